@@ -5,16 +5,27 @@ from discord import app_commands
 import aiosqlite
 from datetime import datetime, timedelta
 import asyncio
+import heapq
+from collections import defaultdict
 from dotenv import load_dotenv
-import pytz
-from typing import Optional, List, Literal, Union
-import math
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError, available_timezones
+from typing import Optional, List, Literal
+import re
+import functools
 import sqlite3
 import traceback
 import logging
 import time
 import sys
 import aiohttp
+import pathlib
+import hashlib
+import json
+
+try:
+    import uvloop  # Faster event loop, not available on Windows
+except ImportError:
+    uvloop = None
 
 # Setup logging first
 logging.basicConfig(
@@ -29,23 +40,114 @@ logger = logging.getLogger('pingur')
 
 # Load and verify environment variables
 load_dotenv()
-TOKEN = os.getenv('DISCORD_TOKEN')
+TOKEN = os.getenv('DISCORD_TOKEN', '').strip()  # Stray whitespace in .env would fail the login
 if not TOKEN:
     logger.error("No Discord token found in environment variables!")
     logger.error("Make sure you have a .env file with DISCORD_TOKEN=your_token")
     sys.exit(1)
 
+# Slash command registration: global sync only when the command tree changed
+# (or when forced), since it is slow and rate limited; dev guilds get an
+# instant guild-scoped sync instead
+SYNC_COMMANDS = os.getenv('SYNC_COMMANDS', '').lower() in ('1', 'true', 'yes')
+# Upper bound on reminder sends in flight at once, so a burst of due
+# reminders doesn't flood Discord's REST API
+MAX_CONCURRENT_SENDS = int(os.getenv('MAX_CONCURRENT_SENDS', '8'))
+DEV_GUILD_IDS = [int(gid) for gid in os.getenv('DEV_GUILD_IDS', '').split(',') if gid.strip()]
+
 # Constants
 ITEMS_PER_PAGE = 5
+TEMPLATES_PER_EMBED = 10  # Keeps each /listtemplates embed under Discord's 6000 char limit
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000  # Discord's limit applies to all embeds of a message combined
+INSERT_BATCH_WINDOW = 0.05  # Seconds to collect concurrent reminder inserts into one commit
+MAX_SCHEDULER_SLEEP = 300  # Upper bound between checks, also retries failed sends
 TIME_UNITS = {
     'minutes': 1,
     'hours': 60,
     'days': 1440
 }
 
+# A user (<@id>, <@!id>) or role (<@&id>) mention, or a bare ID
+TARGET_RE = re.compile(r'<@(&)?!?(\d+)>|\b(\d+)\b')
+# '3pm', '3:30pm', '15:00', 'tomorrow', 'tomorrow 3pm'
+TIME_RE = re.compile(r'(?:(tomorrow)\s*)?(?:(\d{1,2})(?::(\d{2}))?\s*([ap]m)?)?', re.IGNORECASE)
+
+# Frequently used SQL, defined once so every call reuses the same cached statement
+SQL_GUILD_SETTINGS = 'SELECT guild_id, default_channel_id, timezone FROM guild_settings'
+# Just what the pause/resume checks look at, not the whole row
+SQL_REMINDER_STATE = 'SELECT active, interval, time_unit FROM reminders WHERE id = ? AND guild_id = ?'
+SQL_DELETE_REMINDER = 'DELETE FROM reminders WHERE id = ? AND guild_id = ? RETURNING id'
+SQL_PAUSE_REMINDER = 'UPDATE reminders SET active = 0 WHERE id = ? AND guild_id = ? AND active = 1 RETURNING *'
+SQL_INSERT_REMINDER = '''
+    INSERT INTO reminders (
+        guild_id, channel_id, user_id, target_ids, target_type,
+        message, interval, time_unit, last_ping, next_ping,
+        dm, recurring, active, ghost_ping
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    RETURNING *
+'''
+# Columns kept in bot.reminder_cache for each active reminder
+SQL_ACTIVE_REMINDERS = '''
+    SELECT 
+        id,
+        guild_id,
+        channel_id,
+        target_ids,
+        target_type,
+        message,
+        interval,
+        time_unit,
+        CAST(dm AS INTEGER) as dm,
+        CAST(recurring AS INTEGER) as recurring,
+        CAST(ghost_ping AS INTEGER) as ghost_ping,
+        next_ping
+    FROM reminders 
+    WHERE active = 1
+'''
+SQL_RESUME_REMINDER = 'UPDATE reminders SET active = 1, next_ping = ? WHERE id = ? AND active = 0 RETURNING *'
+SQL_UPDATE_RECURRING = 'UPDATE reminders SET last_ping = ?, next_ping = ? WHERE id = ?'
+SQL_UPDATE_ONE_TIME = 'UPDATE reminders SET active = 0, last_ping = ? WHERE id = ?'
+# Selector listings take the flag as a parameter so both variants share one statement.
+# Selectors only show the id and message, and Discord caps them at 25 options.
+SQL_GUILD_REMINDERS_BY_ACTIVE = 'SELECT id, message FROM reminders WHERE guild_id = ? AND active = ? ORDER BY id LIMIT 25'
+SQL_GUILD_REMINDERS_BY_RECURRING = 'SELECT id, message FROM reminders WHERE guild_id = ? AND recurring = ? ORDER BY id LIMIT 25'
+SQL_PAUSE_GUILD = 'UPDATE reminders SET active = 0 WHERE guild_id = ? AND active = 1 RETURNING id'
+# /list pages are fetched by keyset on (next_ping, id), served by idx_reminders_guild_list
+SQL_LIST_COUNT = 'SELECT COUNT(*) FROM reminders WHERE guild_id = ? AND recurring = ?'
+SQL_LIST_PAGE = '''
+    SELECT id, message, interval, time_unit, next_ping, active, recurring, ghost_ping
+    FROM reminders
+    WHERE guild_id = ? AND recurring = ? AND (next_ping, id) > (?, ?)
+    ORDER BY next_ping, id
+    LIMIT ?
+'''
+
+SQL_SET_CHANNEL = '''
+    INSERT INTO guild_settings (guild_id, default_channel_id)
+    VALUES (?, ?)
+    ON CONFLICT(guild_id)
+    DO UPDATE SET default_channel_id = excluded.default_channel_id
+    RETURNING default_channel_id, timezone
+'''
+SQL_SET_TIMEZONE = '''
+    INSERT INTO guild_settings (guild_id, timezone)
+    VALUES (?, ?)
+    ON CONFLICT(guild_id)
+    DO UPDATE SET timezone = excluded.timezone
+    RETURNING default_channel_id, timezone
+'''
+SQL_FIX_TIMEZONE = 'UPDATE guild_settings SET timezone = ? WHERE guild_id = ?'
+SQL_INSERT_TEMPLATE = 'INSERT INTO reminder_templates (guild_id, name, message, time, targets) VALUES (?, ?, ?, ?, ?)'
+SQL_GET_TEMPLATE = 'SELECT * FROM reminder_templates WHERE guild_id = ? AND name = ?'
+SQL_LIST_TEMPLATES = 'SELECT * FROM reminder_templates WHERE guild_id = ?'
+
 # Ensure the database directory exists
 DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'reminders.db')
 os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
+# Digest of the last globally synced command tree, to skip redundant syncs
+COMMAND_HASH_PATH = os.path.join(os.path.dirname(DB_PATH), '.command_tree.sha256')
 
 # Set up required bot intents
 intents = discord.Intents.default()
@@ -57,10 +159,34 @@ class CommandRegistrationError(Exception):
 
 class PingurBot(commands.Bot):
     def __init__(self):
-        super().__init__(command_prefix='!', intents=intents)
+        # The gateway already uses zlib-stream compression; nothing here reads
+        # cached messages, so skip building the message cache on every event
+        super().__init__(command_prefix='!', intents=intents, max_messages=None)
+        # Active reminders by id, so the scheduler never has to scan SQLite
         self.reminder_cache = {}
+        # guild_id -> ids of its active reminders, kept in step with reminder_cache
+        self.guild_reminder_ids = defaultdict(set)
+        # guild_id -> (default_channel_id, timezone), mirrored on every settings write
         self.guild_settings_cache = {}
         self.cache_lock = asyncio.Lock()
+        self.db = None
+        # Read-only connection so listings and due scans never queue behind writes
+        self.db_read = None
+        # All writes on self.db go through db_write/write_lock, one commit at a time
+        self.write_lock = asyncio.Lock()
+        # Reminder inserts waiting for the next group commit, with their result futures
+        self.pending_inserts = []
+        self.insert_flush_task = None
+        # Shared session for the bot's own downloads, so connections are pooled
+        self.http_session = None
+        # Min-heap of (next_ping, reminder_id); entries whose reminder was removed
+        # or rescheduled are skipped lazily when they reach the top
+        self.schedule = []
+        # Set whenever a reminder is added or resumed so the scheduler re-plans
+        self.schedule_changed = asyncio.Event()
+        # Held while due reminders are sent and written back so passes never overlap
+        self.reminder_lock = asyncio.Lock()
+        self.send_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
         logger.info("Bot initialization started")
 
     async def setup_hook(self):
@@ -69,26 +195,49 @@ class PingurBot(commands.Bot):
         
         # Initialize database first
         try:
-            await setup_database()
+            # Open the connection once and share it for the bot's lifetime
+            self.db = await aiosqlite.connect(DB_PATH)
+            # db_operation turns failures into None; nothing can run without the schema
+            if not await setup_database():
+                raise RuntimeError("Database schema could not be created")
+            self.db_read = await aiosqlite.connect(f"{pathlib.Path(DB_PATH).as_uri()}?mode=ro", uri=True)
+            await self.db_read.execute('PRAGMA cache_size=-64000')
+            await self.db_read.execute('PRAGMA mmap_size=268435456')
+            await load_reminder_cache()
+            await load_guild_settings_cache()
             logger.info("Database setup complete")
         except Exception as e:
             logger.error(f"Database setup failed: {e}")
             raise
 
+        self.http_session = aiohttp.ClientSession()
+
+        # Look the owner up once so owner checks never make an HTTP call
+        # before an interaction has been acknowledged
+        try:
+            await self.is_owner(discord.Object(id=0))
+        except Exception as e:
+            logger.warning(f"Could not look up the bot owner, will retry on the first owner check: {e}")
+
         # Then register commands
         try:
             logger.info("Starting command registration...")
-            # Sync commands globally
-            await self.tree.sync()
-            logger.info("Global commands synced")
+            digest = command_tree_digest(self.tree)
+            if SYNC_COMMANDS or digest != stored_command_digest():
+                await sync_global_commands(digest)
+                logger.info("Global commands synced")
+            else:
+                logger.info("Command tree unchanged, skipping global sync")
             
-            # Sync to all guilds
-            for guild in self.guilds:
+            # Guild-scoped syncs show up immediately, handy while developing
+            for guild_id in DEV_GUILD_IDS:
+                guild = discord.Object(id=guild_id)
                 try:
+                    self.tree.copy_global_to(guild=guild)
                     await self.tree.sync(guild=guild)
-                    logger.info(f"Commands synced to guild: {guild.name}")
+                    logger.info(f"Commands synced to guild: {guild_id}")
                 except Exception as e:
-                    logger.error(f"Failed to sync commands to guild {guild.name}: {e}")
+                    logger.error(f"Failed to sync commands to guild {guild_id}: {e}")
             
             logger.info("Command registration complete")
         except Exception as e:
@@ -120,12 +269,51 @@ class PingurBot(commands.Bot):
         except Exception as e:
             logger.error(f"Failed to sync commands to new guild {guild.name}: {e}")
 
+    async def close(self):
+        """Close the shared database connection and HTTP session on shutdown"""
+        await super().close()
+        if self.insert_flush_task is not None and not self.insert_flush_task.done():
+            # Let a queued insert batch land before its connection goes away
+            await self.insert_flush_task
+        if self.http_session is not None:
+            await self.http_session.close()
+            self.http_session = None
+        if self.db_read is not None:
+            await self.db_read.close()
+            self.db_read = None
+        if self.db is not None:
+            await self.db.close()
+            self.db = None
+            logger.info("Database connection closed")
+
+def command_tree_digest(tree: app_commands.CommandTree) -> str:
+    """Hash the global command payload so unchanged trees can skip a sync"""
+    # The application id is part of the hash so a digest copied over from
+    # another bot's deployment never matches
+    payload = [tree.client.application_id, [command.to_dict(tree) for command in tree.get_commands()]]
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+def stored_command_digest() -> Optional[str]:
+    """Digest of the command tree as it was last synced, if any"""
+    try:
+        return pathlib.Path(COMMAND_HASH_PATH).read_text().strip()
+    except OSError:
+        return None
+
+async def sync_global_commands(digest: Optional[str] = None) -> list:
+    """Sync global commands and remember what was pushed"""
+    synced = await bot.tree.sync()
+    try:
+        pathlib.Path(COMMAND_HASH_PATH).write_text(digest or command_tree_digest(bot.tree))
+    except OSError as e:
+        logger.warning(f"Could not store command tree digest: {e}")
+    return synced
+
 # Error handling decorator for database operations
 def db_operation(operation):
     async def wrapper(*args, **kwargs):
         try:
-            async with aiosqlite.connect(DB_PATH) as db:
-                return await operation(db, *args, **kwargs)
+            return await operation(bot.db, *args, **kwargs)
         except sqlite3.Error as e:
             logger.error(f"Database error: {e}")
             traceback.print_exc()
@@ -136,6 +324,194 @@ def db_operation(operation):
             return None
     return wrapper
 
+async def db_fetchone(db: aiosqlite.Connection, sql: str, params=()):
+    """First row of a query in one hop to the connection's thread, or None"""
+    rows = await db.execute_fetchall(sql, params)
+    return rows[0] if rows else None
+
+async def db_write(sql: str, params=()) -> aiosqlite.Cursor:
+    """Run a single write on the shared connection and commit it"""
+    async with bot.write_lock:
+        cursor = await bot.db.execute(sql, params)
+        await bot.db.commit()
+        return cursor
+
+async def db_write_fetchone(sql: str, params=()):
+    """Run a write with a RETURNING clause, commit it, and return the first row"""
+    async with bot.write_lock:
+        row = await db_fetchone(bot.db, sql, params)
+        await bot.db.commit()
+        return row
+
+async def db_write_fetchall(sql: str, params=()) -> list:
+    """Run a write with a RETURNING clause, commit it, and return every row"""
+    async with bot.write_lock:
+        rows = await bot.db.execute_fetchall(sql, params)
+        await bot.db.commit()
+        return rows
+
+async def insert_reminder(values: tuple) -> tuple:
+    """Queue a reminder insert and return its full row once the batch is committed"""
+    future = asyncio.get_running_loop().create_future()
+    bot.pending_inserts.append((values, future))
+    if len(bot.pending_inserts) == 1:
+        bot.insert_flush_task = asyncio.create_task(flush_pending_inserts())
+    return await future
+
+async def flush_pending_inserts():
+    """Write every queued reminder insert in a single transaction"""
+    await asyncio.sleep(INSERT_BATCH_WINDOW)
+    async with bot.write_lock:
+        batch, bot.pending_inserts = bot.pending_inserts, []
+        results = []
+        for values, future in batch:
+            try:
+                rows = await bot.db.execute_fetchall(SQL_INSERT_REMINDER, values)
+                results.append((future, rows[0]))
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+        try:
+            await bot.db.commit()
+        except Exception as e:
+            # Roll back so the next writer's commit doesn't persist rows whose
+            # callers were already told the insert failed
+            await bot.db.rollback()
+            for future, _ in results:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+    # The RETURNING rows go straight into the cache, no read-back needed
+    cache_reminders([active_reminder_columns(row) for _, row in results if row[12]])
+    # A waiter may have been cancelled (e.g. the interaction timed out)
+    for future, row in results:
+        if not future.done():
+            future.set_result(row)
+
+@functools.lru_cache(maxsize=1024)
+def parse_target_ids(target_ids: str) -> tuple:
+    """Split a stored target_ids CSV into ints, memoized per distinct string"""
+    return tuple(int(tid) for tid in target_ids.split(','))
+
+def resolve_targets(guild: discord.Guild, target_ids: tuple, target_type: str) -> list:
+    """Mentions for the targets that still exist in the guild"""
+    get_target = guild.get_member if target_type == 'user' else guild.get_role
+    return [target.mention for target in map(get_target, target_ids) if target]
+
+def parse_targets(guild: discord.Guild, targets: str) -> Optional[tuple]:
+    """Parse mentions/IDs into (target_ids, target_type), or None if users and roles are mixed"""
+    target_ids = []
+    target_type = None
+
+    # One scan over the whole string, so '<@1><@2>' works without spaces too
+    for match in TARGET_RE.finditer(targets):
+        role_flag, mention_id, raw_id = match.groups()
+        if raw_id:
+            target_id = int(raw_id)
+            # Check if it's a role ID, otherwise it must be a valid user ID
+            is_role = guild.get_role(target_id) is not None
+            if not is_role and not guild.get_member(target_id):
+                logger.error(f"Could not find member or role with ID {target_id}")
+                continue
+        else:
+            target_id = int(mention_id)
+            is_role = role_flag is not None
+
+        if target_id:
+            if not target_type:
+                target_type = 'role' if is_role else 'user'
+            elif (target_type == 'role') != is_role:
+                return None
+            target_ids.append(target_id)
+
+    return target_ids, target_type
+
+def cached_reminder(row: tuple) -> tuple:
+    """Cache form of an SQL_ACTIVE_REMINDERS row, with target_ids parsed into ints once"""
+    return row[:3] + (parse_target_ids(row[3]),) + row[4:]
+
+async def load_reminder_cache():
+    """Fill the reminder cache with every active reminder"""
+    rows = await bot.db_read.execute_fetchall(SQL_ACTIVE_REMINDERS)
+    bot.reminder_cache = {row[0]: cached_reminder(row) for row in rows}
+    bot.guild_reminder_ids = defaultdict(set)
+    for row in rows:
+        bot.guild_reminder_ids[row[1]].add(row[0])
+    bot.schedule = [(row[11], row[0]) for row in rows]
+    heapq.heapify(bot.schedule)
+    logger.info(f"Cached {len(rows)} active reminders")
+
+def active_reminder_columns(row: tuple) -> tuple:
+    """Reduce a full reminders row (SELECT * / RETURNING *) to the SQL_ACTIVE_REMINDERS columns"""
+    return row[:3] + row[4:9] + (int(row[11]), int(row[13]), int(row[14]), row[10])
+
+def cache_reminders(rows: list):
+    """Add SQL_ACTIVE_REMINDERS rows to the cache and wake the scheduler"""
+    for row in rows:
+        bot.reminder_cache[row[0]] = cached_reminder(row)
+        bot.guild_reminder_ids[row[1]].add(row[0])
+        heapq.heappush(bot.schedule, (row[11], row[0]))
+    bot.schedule_changed.set()
+
+def uncache_reminder(reminder_id: int):
+    """Drop a reminder that was paused, deleted or finished from the cache"""
+    row = bot.reminder_cache.pop(reminder_id, None)
+    if row:
+        ids = bot.guild_reminder_ids[row[1]]
+        ids.discard(reminder_id)
+        if not ids:
+            del bot.guild_reminder_ids[row[1]]
+
+def cached_guild_reminders(guild_id: int) -> list:
+    """(id, message) of a guild's active reminders, shaped like SQL_GUILD_REMINDERS_BY_ACTIVE"""
+    ids = sorted(bot.guild_reminder_ids.get(guild_id, ()))[:25]
+    return [(rid, bot.reminder_cache[rid][5]) for rid in ids]
+
+@functools.lru_cache(maxsize=1)
+def timezone_names() -> dict:
+    """Lowercased IANA timezone name -> canonical spelling"""
+    return {name.lower(): name for name in available_timezones()}
+
+def canonical_timezone(name: str) -> Optional[str]:
+    """Canonical spelling of a timezone name, matched case-insensitively like pytz did"""
+    return timezone_names().get(name.strip().lower())
+
+async def load_guild_settings_cache():
+    """Fill the guild settings cache from the guild_settings table"""
+    rows = await bot.db_read.execute_fetchall(SQL_GUILD_SETTINGS)
+    cache = {}
+    fixes = []
+    for guild_id, channel_id, timezone in rows:
+        if timezone:
+            # Names saved under pytz may differ in case (e.g. 'us/pacific'),
+            # which ZoneInfo rejects
+            name = canonical_timezone(timezone)
+            if name is None:
+                logger.warning(f"Unknown timezone {timezone!r} for guild {guild_id}, using UTC")
+                name = 'UTC'
+            elif name != timezone:
+                fixes.append((name, guild_id))
+            timezone = name
+        cache[guild_id] = (channel_id, timezone)
+    if fixes:
+        async with bot.write_lock:
+            await bot.db.executemany(SQL_FIX_TIMEZONE, fixes)
+            await bot.db.commit()
+        logger.info(f"Normalized timezone names for {len(fixes)} guilds")
+    bot.guild_settings_cache = cache
+    logger.info(f"Cached settings for {len(rows)} guilds")
+
+def get_guild_timezone(guild_id: int) -> str:
+    """Timezone configured for a guild, UTC if none was set"""
+    settings = bot.guild_settings_cache.get(guild_id)
+    return (settings[1] if settings else None) or 'UTC'
+
+def get_default_channel(guild_id: int) -> Optional[int]:
+    """Default reminder channel configured for a guild, if any"""
+    settings = bot.guild_settings_cache.get(guild_id)
+    return settings[0] if settings else None
+
 # Permission checking
 def check_permissions(interaction: discord.Interaction) -> bool:
     permissions = interaction.channel.permissions_for(interaction.guild.me)
@@ -171,41 +547,54 @@ def cooldown(rate: int, per: float):
         return wrapper
     return decorator
 
-def parse_time(time_str: str, tz: pytz.timezone) -> Optional[datetime]:
-    now = datetime.now(tz)
-    try:
-        if time_str.lower() == 'tomorrow':
-            return now.replace(hour=9, minute=0) + timedelta(days=1)
-        elif 'tomorrow' in time_str.lower():
-            time_part = time_str.lower().replace('tomorrow', '').strip()
-            if 'm' in time_part.lower():
-                parsed_time = datetime.strptime(time_part, '%I%p').time()
-            else:
-                parsed_time = datetime.strptime(time_part, '%H:%M').time()
-            return now.replace(hour=parsed_time.hour, minute=parsed_time.minute) + timedelta(days=1)
-        else:
-            if 'm' in time_str.lower():
-                parsed_time = datetime.strptime(time_str, '%I%p').time()
-            else:
-                parsed_time = datetime.strptime(time_str, '%H:%M').time()
-            result = now.replace(hour=parsed_time.hour, minute=parsed_time.minute)
-            if result < now:
-                result += timedelta(days=1)
-            return result
-    except ValueError:
+def parse_time(time_str: str, tz: ZoneInfo) -> Optional[datetime]:
+    match = TIME_RE.fullmatch(time_str.strip())
+    if not match:
         return None
+    tomorrow, hour, minute, meridiem = match.groups()
+
+    if hour is None:
+        if not tomorrow:
+            return None
+        hour, minute = 9, 0  # Plain 'tomorrow' means tomorrow morning
+    else:
+        # A bare hour is ambiguous, ask for '3pm' or '15:00' instead
+        if minute is None and meridiem is None:
+            return None
+        hour, minute = int(hour), int(minute or 0)
+        if meridiem:
+            if not 1 <= hour <= 12:
+                return None
+            hour = hour % 12 + (12 if meridiem.lower() == 'pm' else 0)
+        if hour > 23 or minute > 59:
+            return None
+
+    now = datetime.now(tz)
+    result = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if tomorrow or result < now:
+        result += timedelta(days=1)
+    return result
 
 bot = PingurBot()
 
 # Database initialization with improved schema
 @db_operation
 async def setup_database(db):
-    # First, check if we need to add the ghost_ping column
-    async with db.execute("PRAGMA table_info(reminders)") as cursor:
-        columns = await cursor.fetchall()
-        has_ghost_ping = any(col[1] == 'ghost_ping' for col in columns)
-
-    if not has_ghost_ping:
+    # Tune the shared connection: WAL lets reads run alongside writes and
+    # synchronous=NORMAL drops the extra fsync per commit
+    await db.execute('PRAGMA journal_mode=WAL')
+    await db.execute('PRAGMA synchronous=NORMAL')
+    await db.execute('PRAGMA temp_store=MEMORY')
+    await db.execute('PRAGMA cache_size=-64000')
+    await db.execute('PRAGMA mmap_size=268435456')
+    await db.execute('PRAGMA busy_timeout=5000')
+
+    # First, check if we need to add the ghost_ping column; on a fresh
+    # database there is no reminders table yet and it is simply created below
+    columns = await db.execute_fetchall("PRAGMA table_info(reminders)")
+    has_ghost_ping = any(col[1] == 'ghost_ping' for col in columns)
+
+    if columns and not has_ghost_ping:
         logger.info("Adding ghost_ping column to reminders table...")
         try:
             # Create a backup of the old table
@@ -300,6 +689,26 @@ async def setup_database(db):
             )
         ''')
     
+    # last_ping is stored as integer unix seconds; convert legacy ISO strings
+    await db.execute('''
+        UPDATE reminders
+        SET last_ping = CAST(strftime('%s', last_ping) AS INTEGER)
+        WHERE typeof(last_ping) = 'text'
+    ''')
+    
+    # Migrate next_ping from ISO text to Unix seconds (naive strings were stored as UTC)
+    await db.execute('''
+        UPDATE reminders
+        SET next_ping = CAST(strftime('%s', next_ping) AS INTEGER)
+        WHERE typeof(next_ping) = 'text' AND strftime('%s', next_ping) IS NOT NULL
+    ''')
+    await db.execute('CREATE INDEX IF NOT EXISTS idx_reminders_due ON reminders(active, next_ping)')
+    # Per-guild lookups: /list filters on recurring and sorts by next_ping,
+    # the pause/resume selectors filter on active
+    await db.execute('DROP INDEX IF EXISTS idx_reminders_guild')
+    await db.execute('CREATE INDEX IF NOT EXISTS idx_reminders_guild_list ON reminders(guild_id, recurring, next_ping)')
+    await db.execute('CREATE INDEX IF NOT EXISTS idx_reminders_guild_active ON reminders(guild_id, active)')
+    
     # Fix any inconsistent boolean values in the database
     await db.execute('UPDATE reminders SET ghost_ping = 0 WHERE ghost_ping IS NULL OR ghost_ping != 1')
     await db.execute('UPDATE reminders SET dm = CASE WHEN dm = 1 THEN 1 ELSE 0 END')
@@ -328,9 +737,11 @@ async def setup_database(db):
     
     await db.commit()
     logger.info("Database initialized successfully")
+    return True
 
+@functools.lru_cache(maxsize=1024)
 def format_time(minutes: int) -> str:
-    """Convert minutes to a readable format"""
+    """Convert minutes to a readable format, memoized since intervals repeat"""
     if minutes < 60:
         return f"{minutes} minute{'s' if minutes != 1 else ''}"
     elif minutes < 1440:
@@ -340,7 +751,7 @@ def format_time(minutes: int) -> str:
         days = minutes / 1440
         return f"{days:.1f} day{'s' if days != 1 else ''}"
 
-async def create_reminder_embed(interaction: discord.Interaction, reminder: tuple, show_controls: bool = False) -> discord.Embed:
+async def create_reminder_embed(interaction: discord.Interaction, reminder: tuple) -> discord.Embed:
     """Create an embed for a reminder"""
     rid, guild_id, channel_id, user_id, target_ids, target_type, msg, interval, time_unit, last_ping, next_ping, dm, active, recurring, ghost_ping, created_at = reminder
     
@@ -350,14 +761,7 @@ async def create_reminder_embed(interaction: discord.Interaction, reminder: tupl
     )
 
     # Get targets (users or roles)
-    targets = []
-    for tid in target_ids.split(','):
-        if target_type == 'user':
-            target = interaction.guild.get_member(int(tid))
-        else:
-            target = interaction.guild.get_role(int(tid))
-        if target:
-            targets.append(target.mention)
+    targets = resolve_targets(interaction.guild, parse_target_ids(target_ids), target_type)
 
     channel = interaction.guild.get_channel(channel_id)
     creator = interaction.guild.get_member(user_id)
@@ -373,7 +777,7 @@ async def create_reminder_embed(interaction: discord.Interaction, reminder: tupl
         value=(
             f"Interval: {format_time(interval)}\n"
             f"Type: {'Recurring' if recurring else 'One-time'}\n"
-            f"Next ping: <t:{int(datetime.fromisoformat(next_ping).timestamp())}:R>"
+            f"Next ping: <t:{next_ping}:R>"
         ),
         inline=True
     )
@@ -396,15 +800,6 @@ async def create_reminder_embed(interaction: discord.Interaction, reminder: tupl
     if creator:
         embed.set_footer(text=f"Created by {creator.display_name}")
 
-    if show_controls:
-        embed.description = (
-            "**Controls**\n"
-            "🗑️ - Delete reminder\n"
-            "✏️ - Edit reminder\n"
-            "⏯️ - Toggle active status\n"
-            "◀️ ▶️ - Navigate pages"
-        )
-
     return embed
 
 @bot.tree.command(name="setchannel", description="Set the default channel for reminders in this server")
@@ -415,14 +810,8 @@ async def set_channel(
     interaction: discord.Interaction,
     channel: discord.TextChannel
 ):
-    async with aiosqlite.connect(DB_PATH) as db:
-        await db.execute('''
-            INSERT INTO guild_settings (guild_id, default_channel_id)
-            VALUES (?, ?)
-            ON CONFLICT(guild_id) 
-            DO UPDATE SET default_channel_id = excluded.default_channel_id
-        ''', (interaction.guild_id, channel.id))
-        await db.commit()
+    settings = await db_write_fetchone(SQL_SET_CHANNEL, (interaction.guild_id, channel.id))
+    bot.guild_settings_cache[interaction.guild_id] = tuple(settings)
 
     embed = discord.Embed(
         title="✅ Default Channel Set",
@@ -444,7 +833,7 @@ async def add_ping(
     interaction: discord.Interaction,
     targets: str,
     time_unit: Literal['minutes', 'hours', 'days'],
-    interval: int,
+    interval: app_commands.Range[int, 1],  # A zero interval would have no next ping
     message: str,
     dm: bool = False,
     channel: Optional[discord.TextChannel] = None
@@ -453,63 +842,18 @@ async def add_ping(
         await interaction.response.defer()
         
         # Get server timezone
-        async with aiosqlite.connect(DB_PATH) as db:
-            async with db.execute('SELECT timezone FROM guild_settings WHERE guild_id = ?', 
-                                (interaction.guild_id,)) as cursor:
-                result = await cursor.fetchone()
-                timezone = result[0] if result else 'UTC'
-
-        tz = pytz.timezone(timezone)
+        tz = ZoneInfo(get_guild_timezone(interaction.guild_id))
         now = datetime.now(tz)
 
         # Parse targets (users and roles)
-        target_ids = []
-        target_type = None
-        
-        for word in targets.split():
-            target_id = None
-            is_role = False
-
-            if word.startswith('<@&'):  # Role mention
-                try:
-                    target_id = int(word[3:-1])
-                    is_role = True
-                except ValueError as e:
-                    logger.error(f"Failed to parse role ID from {word}: {str(e)}")
-                    continue
-            elif word.startswith('<@'):  # User mention
-                try:
-                    target_id = int(word[2:-1].replace('!', ''))
-                except ValueError as e:
-                    logger.error(f"Failed to parse user ID from {word}: {str(e)}")
-                    continue
-            else:  # Raw ID
-                try:
-                    target_id = int(word)
-                    # Check if it's a role ID
-                    role = interaction.guild.get_role(target_id)
-                    if role:
-                        is_role = True
-                    else:
-                        # Check if it's a valid user ID
-                        member = interaction.guild.get_member(target_id)
-                        if not member:
-                            logger.error(f"Could not find member or role with ID {target_id}")
-                            continue
-                except ValueError as e:
-                    logger.error(f"Failed to parse ID from {word}: {str(e)}")
-                    continue
-
-            if target_id:
-                if not target_type:
-                    target_type = 'role' if is_role else 'user'
-                elif (target_type == 'role') != is_role:
-                    await interaction.followup.send(
-                        "Cannot mix users and roles in the same ping!",
-                        ephemeral=True
-                    )
-                    return
-                target_ids.append(target_id)
+        parsed = parse_targets(interaction.guild, targets)
+        if parsed is None:
+            await interaction.followup.send(
+                "Cannot mix users and roles in the same ping!",
+                ephemeral=True
+            )
+            return
+        target_ids, target_type = parsed
 
         if not target_ids:
             await interaction.followup.send(
@@ -552,11 +896,7 @@ async def add_ping(
             channel_id = interaction.channel_id
             if not channel_id:
                 # If not in a channel, try to use the default channel
-                async with aiosqlite.connect(DB_PATH) as db:
-                    async with db.execute('SELECT default_channel_id FROM guild_settings WHERE guild_id = ?', 
-                                        (interaction.guild_id,)) as cursor:
-                        result = await cursor.fetchone()
-                        channel_id = result[0] if result else None
+                channel_id = get_default_channel(interaction.guild_id)
 
                 if not channel_id:
                     await interaction.followup.send(
@@ -565,59 +905,34 @@ async def add_ping(
                     )
                     return
 
-        # Calculate next ping time
-        interval_minutes = interval * TIME_UNITS[time_unit]
-        next_ping = now + timedelta(minutes=interval_minutes)
-        
-        # Ensure timezone-aware datetime storage
-        if next_ping.tzinfo is None:
-            next_ping = tz.localize(next_ping)
-        next_ping = next_ping.astimezone(pytz.utc)
+        # Calculate next ping time (Unix seconds)
+        now_ts = int(now.timestamp())
+        next_ping = now_ts + interval * TIME_UNITS[time_unit] * 60
 
         # Insert the reminder with explicit boolean values
-        async with aiosqlite.connect(DB_PATH) as db:
-            cursor = await db.execute('''
-                INSERT INTO reminders (
-                    guild_id, channel_id, user_id, target_ids, target_type,
-                    message, interval, time_unit, last_ping, next_ping,
-                    dm, recurring, active, ghost_ping
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                interaction.guild_id, 
-                channel_id,
-                interaction.user.id,
-                ','.join(map(str, target_ids)),
-                target_type,
-                message,
-                interval,
-                time_unit,
-                now.astimezone(pytz.utc).isoformat(),  # Store in UTC
-                next_ping.isoformat(),
-                1 if dm else 0,  # Explicit integer for boolean
-                1,  # Always recurring for interval-based pings
-                1,  # Active by default
-                0   # Explicitly not a ghost ping
-            ))
-            await db.commit()
-            
-            # Get the ID of the inserted reminder
-            cursor = await db.execute('SELECT last_insert_rowid()')
-            row = await cursor.fetchone()
-            reminder_id = row[0]
-
-            # Log the creation with all boolean values
-            logger.info(f"Created new reminder #{reminder_id} (dm={1 if dm else 0}, recurring=1, active=1, ghost_ping=0)")
+        reminder = await insert_reminder((
+            interaction.guild_id, 
+            channel_id,
+            interaction.user.id,
+            ','.join(map(str, target_ids)),
+            target_type,
+            message,
+            interval,
+            time_unit,
+            now_ts,  # Unix seconds
+            next_ping,
+            1 if dm else 0,  # Explicit integer for boolean
+            1,  # Always recurring for interval-based pings
+            1,  # Active by default
+            0   # Explicitly not a ghost ping
+        ))
+        reminder_id = reminder[0]
+
+        # Log the creation with all boolean values
+        logger.info(f"Created new reminder #{reminder_id} (dm={1 if dm else 0}, recurring=1, active=1, ghost_ping=0)")
 
         # Get targets for display
-        targets_display = []
-        for tid in target_ids:
-            if target_type == 'user':
-                target = interaction.guild.get_member(int(tid))
-            else:
-                target = interaction.guild.get_role(int(tid))
-            if target:
-                targets_display.append(target.mention)
+        targets_display = resolve_targets(interaction.guild, target_ids, target_type)
 
         # Get channel for display
         channel_display = interaction.guild.get_channel(channel_id) if channel_id else None
@@ -671,14 +986,7 @@ async def add_reminder(
         await interaction.response.defer()
         
         # Get server timezone
-        async with aiosqlite.connect(DB_PATH) as db:
-            async with db.execute('SELECT timezone FROM guild_settings WHERE guild_id = ?', 
-                                (interaction.guild_id,)) as cursor:
-                result = await cursor.fetchone()
-                timezone = result[0] if result else 'UTC'
-
-        tz = pytz.timezone(timezone)
-        now = datetime.now(tz)
+        tz = ZoneInfo(get_guild_timezone(interaction.guild_id))
 
         # Parse the time string
         target_time = parse_time(time, tz)
@@ -691,55 +999,19 @@ async def add_reminder(
                 ephemeral=True
             )
             return
+        # Everything below works in Unix seconds, no more aware-datetime math
+        now_ts = int(datetime.now(tz).timestamp())
+        target_ts = int(target_time.timestamp())
 
         # Parse targets (users and roles)
-        target_ids = []
-        target_type = None
-        
-        for word in targets.split():
-            target_id = None
-            is_role = False
-
-            if word.startswith('<@&'):  # Role mention
-                try:
-                    target_id = int(word[3:-1])
-                    is_role = True
-                except ValueError as e:
-                    logger.error(f"Failed to parse role ID from {word}: {str(e)}")
-                    continue
-            elif word.startswith('<@'):  # User mention
-                try:
-                    target_id = int(word[2:-1].replace('!', ''))
-                except ValueError as e:
-                    logger.error(f"Failed to parse user ID from {word}: {str(e)}")
-                    continue
-            else:  # Raw ID
-                try:
-                    target_id = int(word)
-                    # Check if it's a role ID
-                    role = interaction.guild.get_role(target_id)
-                    if role:
-                        is_role = True
-                    else:
-                        # Check if it's a valid user ID
-                        member = interaction.guild.get_member(target_id)
-                        if not member:
-                            logger.error(f"Could not find member or role with ID {target_id}")
-                            continue
-                except ValueError as e:
-                    logger.error(f"Failed to parse ID from {word}: {str(e)}")
-                    continue
-
-            if target_id:
-                if not target_type:
-                    target_type = 'role' if is_role else 'user'
-                elif (target_type == 'role') != is_role:
-                    await interaction.followup.send(
-                        "Cannot mix users and roles in the same reminder!",
-                        ephemeral=True
-                    )
-                    return
-                target_ids.append(target_id)
+        parsed = parse_targets(interaction.guild, targets)
+        if parsed is None:
+            await interaction.followup.send(
+                "Cannot mix users and roles in the same reminder!",
+                ephemeral=True
+            )
+            return
+        target_ids, target_type = parsed
 
         if not target_ids:
             await interaction.followup.send(
@@ -782,11 +1054,7 @@ async def add_reminder(
             channel_id = interaction.channel_id
             if not channel_id:
                 # If not in a channel, try to use the default channel
-                async with aiosqlite.connect(DB_PATH) as db:
-                    async with db.execute('SELECT default_channel_id FROM guild_settings WHERE guild_id = ?', 
-                                        (interaction.guild_id,)) as cursor:
-                        result = await cursor.fetchone()
-                        channel_id = result[0] if result else None
+                channel_id = get_default_channel(interaction.guild_id)
 
                 if not channel_id:
                     await interaction.followup.send(
@@ -797,7 +1065,7 @@ async def add_reminder(
 
         # Set interval based on repeat type
         if repeat == 'never':
-            interval = int((target_time - now).total_seconds() / 60)
+            interval = (target_ts - now_ts) // 60
             recurring = False
         elif repeat == 'daily':
             interval = 1440  # 24 hours in minutes
@@ -807,46 +1075,29 @@ async def add_reminder(
             recurring = True
 
         # Insert the reminder
-        async with aiosqlite.connect(DB_PATH) as db:
-            cursor = await db.execute('''
-                INSERT INTO reminders (
-                    guild_id, channel_id, user_id, target_ids, target_type,
-                    message, interval, time_unit, last_ping, next_ping,
-                    dm, recurring, active, ghost_ping
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                interaction.guild_id, 
-                channel_id,
-                interaction.user.id,
-                ','.join(map(str, target_ids)),
-                target_type,
-                message,
-                interval,
-                'minutes',
-                now.isoformat(),
-                target_time.isoformat(),
-                dm,
-                recurring,
-                True,
-                False  # Not a ghost ping
-            ))
-            await db.commit()
-
-            # Get the ID of the inserted reminder
-            cursor = await db.execute('SELECT last_insert_rowid()')
-            row = await cursor.fetchone()
-            reminder_id = row[0]
-
-            # Fetch the newly created reminder
-            async with db.execute('SELECT * FROM reminders WHERE id = ?', (reminder_id,)) as cursor:
-                reminder = await cursor.fetchone()
+        values = (
+            interaction.guild_id, 
+            channel_id,
+            interaction.user.id,
+            ','.join(map(str, target_ids)),
+            target_type,
+            message,
+            interval,
+            'minutes',
+            now_ts,  # Unix seconds
+            target_ts,
+            dm,
+            recurring,
+            True,
+            False  # Not a ghost ping
+        )
+        reminder = await insert_reminder(values)
 
         embed = await create_reminder_embed(interaction, reminder)
         embed.title = "✅ New Reminder Created"
         embed.add_field(
             name="🕒 Schedule",
-            value=f"At {target_time.strftime('%I:%M %p')} {timezone}\nRepeat: {repeat}",
+            value=f"At <t:{target_ts}:t> (<t:{target_ts}:R>)\nRepeat: {repeat}",
             inline=False
         )
         
@@ -873,31 +1124,26 @@ async def save_template(
     time: Optional[str] = None,
     targets: Optional[str] = None
 ):
-    async with aiosqlite.connect(DB_PATH) as db:
-        try:
-            await db.execute('''
-                INSERT INTO reminder_templates (guild_id, name, message, time, targets)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (interaction.guild_id, name, message, time, targets))
-            await db.commit()
+    try:
+        await db_write(SQL_INSERT_TEMPLATE, (interaction.guild_id, name, message, time, targets))
 
-            embed = discord.Embed(
-                title="✅ Template Saved",
-                description=f"Template `{name}` has been saved",
-                color=discord.Color.green()
-            )
-            embed.add_field(name="Message", value=message, inline=False)
-            if time:
-                embed.add_field(name="Default Time", value=time, inline=True)
-            if targets:
-                embed.add_field(name="Default Targets", value=targets, inline=True)
-
-            await interaction.response.send_message(embed=embed)
-        except sqlite3.IntegrityError:
-            await interaction.response.send_message(
-                f"❌ A template named `{name}` already exists!",
-                ephemeral=True
-            )
+        embed = discord.Embed(
+            title="✅ Template Saved",
+            description=f"Template `{name}` has been saved",
+            color=discord.Color.green()
+        )
+        embed.add_field(name="Message", value=message, inline=False)
+        if time:
+            embed.add_field(name="Default Time", value=time, inline=True)
+        if targets:
+            embed.add_field(name="Default Targets", value=targets, inline=True)
+
+        await interaction.response.send_message(embed=embed)
+    except sqlite3.IntegrityError:
+        await interaction.response.send_message(
+            f"❌ A template named `{name}` already exists!",
+            ephemeral=True
+        )
 
 @bot.tree.command(name="usetemplate", description="Create a reminder from a template")
 @app_commands.describe(
@@ -915,57 +1161,62 @@ async def use_template(
     dm: bool = False,
     channel: Optional[discord.TextChannel] = None
 ):
-    async with aiosqlite.connect(DB_PATH) as db:
-        async with db.execute(
-            'SELECT * FROM reminder_templates WHERE guild_id = ? AND name = ?',
-            (interaction.guild_id, template_name)
-        ) as cursor:
-            template = await cursor.fetchone()
-
-        if not template:
-            await interaction.response.send_message(
-                f"❌ Template `{template_name}` not found!",
-                ephemeral=True
-            )
-            return
+    template = await db_fetchone(bot.db_read, SQL_GET_TEMPLATE, (interaction.guild_id, template_name))
 
-        # Use template values or overrides
-        final_time = time or template[3]
-        final_targets = targets or template[4]
-        
-        if not final_time:
-            await interaction.response.send_message(
-                "❌ No time specified! Please provide a time.",
-                ephemeral=True
-            )
-            return
+    if not template:
+        await interaction.response.send_message(
+            f"❌ Template `{template_name}` not found!",
+            ephemeral=True
+        )
+        return
 
-        if not final_targets:
-            await interaction.response.send_message(
-                "❌ No targets specified! Please provide targets.",
-                ephemeral=True
-            )
-            return
+    # Use template values or overrides
+    final_time = time or template[3]
+    final_targets = targets or template[4]
+    
+    if not final_time:
+        await interaction.response.send_message(
+            "❌ No time specified! Please provide a time.",
+            ephemeral=True
+        )
+        return
 
-        # Create the reminder using the template
-        await add_reminder(
-            interaction=interaction,
-            targets=final_targets,
-            time=final_time,
-            repeat=template[5],
-            message=template[2],  # template message
-            dm=dm,
-            channel=channel
+    if not final_targets:
+        await interaction.response.send_message(
+            "❌ No targets specified! Please provide targets.",
+            ephemeral=True
         )
+        return
+
+    # Create the reminder using the template
+    await add_reminder(
+        interaction=interaction,
+        targets=final_targets,
+        time=final_time,
+        repeat=template[5],
+        message=template[2],  # template message
+        dm=dm,
+        channel=channel
+    )
+
+def group_embeds(embeds: List[discord.Embed]) -> List[List[discord.Embed]]:
+    """Pack embeds into as few messages as Discord's per-message limits allow"""
+    messages = []
+    current, current_chars = [], 0
+    for embed in embeds:
+        chars = len(embed)
+        if current and (len(current) == MAX_EMBEDS_PER_MESSAGE
+                        or current_chars + chars > MAX_EMBED_CHARS_PER_MESSAGE):
+            messages.append(current)
+            current, current_chars = [], 0
+        current.append(embed)
+        current_chars += chars
+    messages.append(current)
+    return messages
 
 @bot.tree.command(name="listtemplates", description="List all saved reminder templates")
 async def list_templates(interaction: discord.Interaction):
-    async with aiosqlite.connect(DB_PATH) as db:
-        async with db.execute(
-            'SELECT * FROM reminder_templates WHERE guild_id = ?',
-            (interaction.guild_id,)
-        ) as cursor:
-            templates = await cursor.fetchall()
+    templates = await bot.db_read.execute_fetchall(SQL_LIST_TEMPLATES, (interaction.guild_id,))
 
     if not templates:
         await interaction.response.send_message(
@@ -974,45 +1225,117 @@ async def list_templates(interaction: discord.Interaction):
         )
         return
 
-    embed = discord.Embed(
-        title="📋 Reminder Templates",
-        color=discord.Color.blue()
-    )
+    # Split large template lists across several messages so no single
+    # embed goes over Discord's size limits and gets rejected
+    embeds = []
+    for start in range(0, len(templates), TEMPLATES_PER_EMBED):
+        embed = discord.Embed(
+            title="📋 Reminder Templates",
+            color=discord.Color.blue()
+        )
 
-    for template in templates:
-        name = template[2]
-        message = template[3]
-        time = template[4] or "Not set"
-        targets = template[5] or "Not set"
+        for template in templates[start:start + TEMPLATES_PER_EMBED]:
+            name = template[2][:100]
+            message = template[3]
+            time = (template[4] or "Not set")[:100]
+            targets = (template[5] or "Not set")[:100]
 
-        embed.add_field(
-            name=f"📝 {name}",
-            value=f"Message: {message}\nTime: {time}\nTargets: {targets}",
-            inline=False
-        )
+            embed.add_field(
+                name=f"📝 {name}",
+                value=f"Message: {message[:100]}{'...' if len(message) > 100 else ''}\nTime: {time}\nTargets: {targets}",
+                inline=False
+            )
+        embeds.append(embed)
 
-    await interaction.response.send_message(embed=embed)
+    messages = group_embeds(embeds)
+    await interaction.response.send_message(embeds=messages[0])
+    # Followups are sent in order so the pages stay sorted
+    for message_embeds in messages[1:]:
+        await interaction.followup.send(embeds=message_embeds)
 
 class ListView(discord.ui.View):
-    def __init__(self, reminders, timezone, type):
+    def __init__(self, guild_id, type, total):
         super().__init__(timeout=300)
-        self.reminders = reminders
-        self.timezone = timezone
+        self.guild_id = guild_id
         self.type = type
         self.page = 0
-        self.max_pages = math.ceil(len(reminders) / ITEMS_PER_PAGE)
+        self.max_pages = -(-total // ITEMS_PER_PAGE)
+        # Keyset (next_ping, id) each page starts after
+        self.cursors = [(-1, -1)]
+        # Formatted fields of the pages visited so far, so going back needs no query
+        self.pages = {}
+        # PRAGMA data_version the cached pages were read at; it changes on every
+        # commit from the write connection, so pages are never shown after a write
+        self.data_version = None
+        self.fields = []
+
+    async def load_page(self):
+        """Fetch and format the rows of the current page"""
+        data_version = (await bot.db_read.execute_fetchall('PRAGMA data_version'))[0][0]
+        if data_version != self.data_version:
+            if self.data_version is not None:
+                # Reminders changed since the pages were read: recount, drop the
+                # cached pages and the cursors that came from them
+                total = (await bot.db_read.execute_fetchall(SQL_LIST_COUNT, (self.guild_id, self.type == 'pings')))[0][0]
+                self.max_pages = -(-total // ITEMS_PER_PAGE)
+                self.page = min(self.page, max(self.max_pages - 1, 0))
+                self.pages.clear()
+                del self.cursors[self.page + 1:]
+            self.data_version = data_version
+        # Rows deleted since /list opened can leave fewer pages than max_pages
+        self.page = min(self.page, len(self.cursors) - 1)
+        if self.page in self.pages:
+            self.fields = self.pages[self.page]
+            self.update_button_states()
+            return
+
+        last_ping, last_id = self.cursors[self.page]
+        rows = await bot.db_read.execute_fetchall(
+            SQL_LIST_PAGE,
+            (self.guild_id, self.type == 'pings', last_ping, last_id, ITEMS_PER_PAGE)
+        )
+
+        self.fields = self.pages[self.page] = [self.format_field(row) for row in rows]
+        if rows and len(self.cursors) == self.page + 1:
+            self.cursors.append((rows[-1][4], rows[-1][0]))
         self.update_button_states()
 
+    @staticmethod
+    def format_field(reminder) -> tuple:
+        """Embed field name and value for one row of the /list query"""
+        rid, msg, interval, time_unit, next_ping, active, recurring, ghost_ping = reminder
+
+        # Format the next ping time
+        next_ping_str = f"<t:{next_ping}:R>"
+
+        # Format the interval
+        if recurring:
+            interval_str = f"Every {interval} {time_unit}"
+        else:
+            interval_str = "One-time"
+
+        # Format status
+        status = "🟢 Active" if active else "🔴 Inactive"
+        ghost = "👻" if ghost_ping else ""
+
+        return (
+            f"#{rid} - {status} {ghost}",
+            f"⏰ Next: {next_ping_str}\n📅 {interval_str}\n💬 {msg[:100]}{'...' if len(msg) > 100 else ''}"
+        )
+
     def update_button_states(self):
         # Update Previous button state
         self.prev_button.disabled = self.page <= 0
-        # Update Next button state
-        self.next_button.disabled = self.page >= self.max_pages - 1
+        # Update Next button state; a short page means nothing follows it,
+        # whatever the count taken when /list opened said
+        self.next_button.disabled = (
+            self.page >= self.max_pages - 1
+            or len(self.fields) < ITEMS_PER_PAGE
+            or len(self.cursors) <= self.page + 1
+        )
 
     def get_embed(self) -> discord.Embed:
-        start_idx = self.page * ITEMS_PER_PAGE
-        end_idx = min(start_idx + ITEMS_PER_PAGE, len(self.reminders))
-        current_reminders = self.reminders[start_idx:end_idx]
+        current_fields = self.fields
 
         embed = discord.Embed(
             title=f"📋 {'Pings' if self.type == 'pings' else 'Reminders'} List",
@@ -1020,30 +1343,10 @@ class ListView(discord.ui.View):
             color=discord.Color.blue()
         )
 
-        for reminder in current_reminders:
-            rid, guild_id, channel_id, user_id, target_ids, target_type, msg, interval, time_unit, last_ping, next_ping, dm, active, recurring, ghost_ping, created_at = reminder
-            
-            # Format the next ping time
-            next_ping_dt = datetime.fromisoformat(next_ping)
-            next_ping_str = f"<t:{int(next_ping_dt.timestamp())}:R>"
-
-            # Format the interval
-            if recurring:
-                interval_str = f"Every {interval} {time_unit}"
-            else:
-                interval_str = "One-time"
-
-            # Format status
-            status = "🟢 Active" if active else "🔴 Inactive"
-            ghost = "👻" if ghost_ping else ""
+        for name, value in current_fields:
+            embed.add_field(name=name, value=value, inline=False)
 
-            embed.add_field(
-                name=f"#{rid} - {status} {ghost}",
-                value=f"⏰ Next: {next_ping_str}\n📅 {interval_str}\n💬 {msg[:100]}{'...' if len(msg) > 100 else ''}",
-                inline=False
-            )
-
-        if not current_reminders:
+        if not current_fields:
             embed.description = f"No {'pings' if self.type == 'pings' else 'reminders'} found."
 
         return embed
@@ -1051,13 +1354,13 @@ class ListView(discord.ui.View):
     @discord.ui.button(label="Previous", style=discord.ButtonStyle.gray, emoji="◀️")
     async def prev_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         self.page = max(0, self.page - 1)
-        self.update_button_states()
+        await self.load_page()
         await interaction.response.edit_message(embed=self.get_embed(), view=self)
 
     @discord.ui.button(label="Next", style=discord.ButtonStyle.gray, emoji="▶️")
     async def next_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         self.page = min(self.max_pages - 1, self.page + 1)
-        self.update_button_states()
+        await self.load_page()
         await interaction.response.edit_message(embed=self.get_embed(), view=self)
 
 @bot.tree.command(name="list", description="View upcoming reminders in chronological order")
@@ -1071,32 +1374,20 @@ async def list_reminders(
     try:
         await interaction.response.defer()
         
-        async with aiosqlite.connect(DB_PATH) as db:
-            # Get timezone
-            async with db.execute('SELECT timezone FROM guild_settings WHERE guild_id = ?', 
-                                (interaction.guild_id,)) as cursor:
-                result = await cursor.fetchone()
-                timezone = result[0] if result else 'UTC'
-
-            # Get reminders
-            query = '''
-                SELECT *
-                FROM reminders
-                WHERE guild_id = ? AND recurring = ?
-                ORDER BY next_ping ASC
-            '''
-            
-            async with db.execute(query, (interaction.guild_id, type == 'pings')) as cursor:
-                reminders = await cursor.fetchall()
+        # Only the count is read up front; ListView fetches one page at a time.
+        # Next ping times render as Discord timestamps, so the server timezone
+        # is not needed here.
+        total = (await bot.db_read.execute_fetchall(SQL_LIST_COUNT, (interaction.guild_id, type == 'pings')))[0][0]
 
-        if not reminders:
+        if not total:
             await interaction.followup.send(
                 f"❌ No {type} found!",
                 ephemeral=True
             )
             return
 
-        view = ListView(reminders, timezone, type)
+        view = ListView(interaction.guild_id, type, total)
+        await view.load_page()
         await interaction.followup.send(embed=view.get_embed(), view=view)
     except Exception as e:
         logger.error(f"Error in list command: {str(e)}")
@@ -1106,157 +1397,237 @@ async def list_reminders(
             ephemeral=True
         )
 
-@tasks.loop(seconds=30)  # Check more frequently for accuracy
-async def check_reminders():
-    """Check and send reminders"""
-    try:
-        now = datetime.now(pytz.utc)
+async def send_reminder(guild, id, targets, target_type, channel_id, message, is_dm, is_ghost_ping) -> bool:
+    """Deliver a single reminder, returning True if it was sent
+
+    targets are members for DM reminders and mention strings for channel pings.
+    """
+    if is_dm and target_type == 'user':
+        results = await asyncio.gather(
+            *(target.send(f'{message}') for target in targets),
+            return_exceptions=True
+        )
+        sent = False
+        for target, result in zip(targets, results):
+            if isinstance(result, Exception):
+                logger.error(f'Failed to DM {target.name} for reminder {id}: {str(result)}')
+            else:
+                sent = True
+                logger.info(f"Sent DM for reminder {id} to {target.name}")
+        return sent
+
+    channel = guild.get_channel(channel_id)
+    if not channel:
+        logger.error(f'Could not find channel {channel_id} for reminder {id}')
+        return False
         
-        async with aiosqlite.connect(DB_PATH) as db:
-            # First, let's log the column names to debug
-            async with db.execute("PRAGMA table_info(reminders)") as cursor:
-                columns = await cursor.fetchall()
-                logger.info(f"Database columns: {[col[1] for col in columns]}")
-            
-            # Use explicit column names in the SELECT statement and proper WHERE clause
-            async with db.execute('''
-                SELECT 
-                    id,
-                    guild_id,
-                    channel_id,
-                    user_id,
-                    target_ids,
-                    target_type,
-                    message,
-                    interval,
-                    time_unit,
-                    last_ping,
-                    next_ping,
-                    CAST(dm AS INTEGER) as dm,
-                    CAST(active AS INTEGER) as active,
-                    CAST(recurring AS INTEGER) as recurring,
-                    CAST(ghost_ping AS INTEGER) as ghost_ping,
-                    created_at
-                FROM reminders 
-                WHERE active = 1 AND next_ping <= ?
-                ORDER BY next_ping ASC
-            ''', (now.isoformat(),)) as cursor:
-                reminders = await cursor.fetchall()
+    # Check permissions before sending
+    bot_member = guild.me
+    channel_perms = channel.permissions_for(bot_member)
+    
+    if not channel_perms.send_messages:
+        logger.error(f'Missing send_messages permission in channel {channel.name} for reminder {id}')
+        return False
+        
+    if is_ghost_ping and not channel_perms.manage_messages:
+        logger.error(f'Missing manage_messages permission in channel {channel.name} for ghost ping {id}')
+        return False
 
-            for reminder in reminders:
-                try:
-                    # Log the raw reminder data for debugging
-                    logger.info(f"Raw reminder data: {reminder}")
-                    
-                    # Properly unpack all fields in the correct order
-                    (id, guild_id, channel_id, user_id, target_ids_str, target_type, 
-                     message, interval, time_unit, last_ping, next_ping, dm, active, 
-                     recurring, ghost_ping, created_at) = reminder
-                    
-                    # Log the values before conversion
-                    logger.info(f"Before conversion - dm: {dm}, active: {active}, recurring: {recurring}, ghost_ping: {ghost_ping}")
-                    
-                    # Convert to boolean using the CAST values (should now be proper integers)
-                    is_dm = bool(dm)
-                    is_active = bool(active)
-                    is_recurring = bool(recurring)
-                    is_ghost_ping = bool(ghost_ping)
-                    
-                    logger.info(f"Processing reminder {id} (ghost_ping={is_ghost_ping}, active={is_active}, recurring={is_recurring}, dm={is_dm})")
-                    
-                    # Get the guild
-                    guild = bot.get_guild(guild_id)
-                    if not guild:
-                        logger.error(f'Could not find guild {guild_id} for reminder {id}')
-                        continue
+    mentions = ' '.join(targets)
+    sent_message = await channel.send(f'{mentions} {message}')
+    
+    # Only delete if this is explicitly a ghost ping. The delayed delete runs in
+    # the background so the gathered sends of this pass don't wait on it.
+    if is_ghost_ping:
+        await sent_message.delete(delay=0.1)  # Brief delay to ensure the ping goes through
+        logger.info(f"Scheduled ghost ping deletion for reminder {id}")
+    else:
+        logger.info(f"Regular ping message sent and kept for reminder {id}")
+    return True
+
+async def bounded_send(send, destination_lock: asyncio.Lock):
+    """Await a send after earlier ones to its destination, holding a send slot"""
+    # The destination lock is taken first so a rate-limited channel only ever
+    # occupies one semaphore slot instead of starving other channels
+    async with destination_lock:
+        async with bot.send_semaphore:
+            return await send
+
+async def wait_for_next_reminder():
+    """Sleep until the next reminder is due or the schedule changes"""
+    bot.schedule_changed.clear()
+    timeout = MAX_SCHEDULER_SLEEP
+    try:
+        schedule = bot.schedule
+        # Drop entries for reminders that were removed or moved to a later ping
+        while schedule:
+            next_ping, reminder_id = schedule[0]
+            row = bot.reminder_cache.get(reminder_id)
+            if row and row[11] <= next_ping:
+                break
+            heapq.heappop(schedule)
+        if schedule:
+            delay = schedule[0][0] - time.time()
+            timeout = min(max(delay, 0), MAX_SCHEDULER_SLEEP)
+        else:
+            # Nothing scheduled: stay asleep until a reminder is added or resumed
+            timeout = None
+    except Exception as e:
+        logger.error(f'Error finding next reminder: {str(e)}')
+        traceback.print_exc()
+
+    try:
+        await asyncio.wait_for(bot.schedule_changed.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
 
-                    # Get targets
-                    target_ids = [int(tid) for tid in target_ids_str.split(',')]
-                    targets = []
-                    for tid in target_ids:
-                        if target_type == 'user':
-                            target = guild.get_member(tid)
-                        else:
-                            target = guild.get_role(tid)
-                        if target:
-                            targets.append(target)
+async def process_due_reminders():
+    """Send every reminder that is due and record the pings
 
+    Due rows come from the cache and the sends run with no database work in
+    flight; only the final batched UPDATE takes the write lock.
+    """
+    try:
+        now_ts = int(time.time())
+        
+        # Due rows are popped off the schedule heap; next_ping is Unix seconds
+        schedule = bot.schedule
+        due = {}
+        while schedule and schedule[0][0] <= now_ts:
+            _, reminder_id = heapq.heappop(schedule)
+            row = bot.reminder_cache.get(reminder_id)
+            if row and row[11] <= now_ts:
+                due[reminder_id] = row
+        reminders = sorted(due.values(), key=lambda row: row[11])
+
+        # Sends for every due reminder are started together and awaited at once
+        pending = []
+        sends = []
+        # Bound once instead of looked up on every row
+        get_guild = bot.get_guild
+        # One lock per channel (or per DM reminder) so sends to a destination go out in order
+        destination_locks = defaultdict(asyncio.Lock)
+
+        # Rows are plain tuples (no row_factory), unpacked straight in the loop header
+        for (id, guild_id, channel_id, target_ids, target_type,
+             message, interval, time_unit, dm, recurring, ghost_ping, next_ping) in reminders:
+            try:
+                # Skip rows for guilds this session can't see before doing any work on them
+                guild = get_guild(guild_id)
+                if not guild:
+                    logger.error(f'Could not find guild {guild_id} for reminder {id}')
+                    continue
+
+                # Convert to boolean using the CAST values (should now be proper integers)
+                is_dm = bool(dm)
+                is_recurring = bool(recurring)
+                is_ghost_ping = bool(ghost_ping)
+                
+                logger.info(f"Processing reminder {id} (ghost_ping={is_ghost_ping}, recurring={is_recurring}, dm={is_dm})")
+
+                # Get targets (ids were parsed when the reminder was cached)
+                if is_dm and target_type == 'user':
+                    # DMs need the member objects (discord.py caches their DM channels)
+                    targets = [member for member in map(guild.get_member, target_ids) if member]
                     if not targets:
                         logger.error(f'No valid targets found for reminder {id} in guild {guild.name}')
                         continue
-
-                    try:
-                        if is_dm and target_type == 'user':
-                            for target in targets:
-                                await target.send(f'{message}')
-                                logger.info(f"Sent DM for reminder {id} to {target.name}")
-                        else:
-                            channel = guild.get_channel(channel_id)
-                            if not channel:
-                                logger.error(f'Could not find channel {channel_id} for reminder {id}')
-                                continue
-                                
-                            # Check permissions before sending
-                            bot_member = guild.me
-                            channel_perms = channel.permissions_for(bot_member)
-                            
-                            if not channel_perms.send_messages:
-                                logger.error(f'Missing send_messages permission in channel {channel.name} for reminder {id}')
-                                continue
-                                
-                            if is_ghost_ping and not channel_perms.manage_messages:
-                                logger.error(f'Missing manage_messages permission in channel {channel.name} for ghost ping {id}')
-                                continue
-
-                            mentions = ' '.join(target.mention for target in targets)
-                            sent_message = await channel.send(f'{mentions} {message}')
-                            
-                            # Only delete if this is explicitly a ghost ping
-                            if is_ghost_ping:
-                                try:
-                                    await asyncio.sleep(0.1)  # Brief delay to ensure the ping goes through
-                                    await sent_message.delete()
-                                    logger.info(f"Successfully deleted ghost ping message for reminder {id}")
-                                except Exception as e:
-                                    logger.error(f'Failed to delete ghost ping message for reminder {id}: {str(e)}')
-                            else:
-                                logger.info(f"Regular ping message sent and kept for reminder {id}")
-
-                        # Update last ping and next ping times
-                        if is_recurring:
-                            # Calculate next ping time using UTC
-                            interval_minutes = interval * TIME_UNITS[time_unit]
-                            next_ping_time = now + timedelta(minutes=interval_minutes)
-                            
-                            await db.execute('''
-                                UPDATE reminders 
-                                SET last_ping = ?, next_ping = ? 
-                                WHERE id = ?
-                            ''', (now.isoformat(), next_ping_time.isoformat(), id))
-                        else:
-                            # For non-recurring reminders, deactivate after sending
-                            await db.execute('''
-                                UPDATE reminders 
-                                SET active = 0, last_ping = ? 
-                                WHERE id = ?
-                            ''', (now.isoformat(), id))
-                        
-                        await db.commit()
-                        logger.info(f"Updated reminder {id} after sending")
-                        
-                    except Exception as e:
-                        logger.error(f'Error sending reminder {id}: {str(e)}')
-                        traceback.print_exc()
-                        
+                else:
+                    # Channel pings only need mention syntax, which Discord resolves itself
+                    prefix = '<@&' if target_type == 'role' else '<@'
+                    targets = [f'{prefix}{tid}>' for tid in target_ids]
+
+                pending.append((id, interval, time_unit, is_recurring, next_ping))
+                destination = ('dm', id) if is_dm and target_type == 'user' else channel_id
+                sends.append(bounded_send(send_reminder(
+                    guild, id, targets, target_type, channel_id, message, is_dm, is_ghost_ping
+                ), destination_locks[destination]))
+                
+            except Exception as e:
+                logger.error(f'Error processing reminder {id}: {str(e)}')
+                traceback.print_exc()
+                continue
+
+        results = await asyncio.gather(*sends, return_exceptions=True)
+
+        # Collected from the send results and written back in one transaction
+        recurring_updates = []
+        one_time_updates = []
+
+        for (id, interval, time_unit, is_recurring, scheduled), result in zip(pending, results):
+            if isinstance(result, Exception):
+                logger.error(f'Error sending reminder {id}: {str(result)}')
+                traceback.print_exception(type(result), result, result.__traceback__)
+                continue
+            if not result:
+                continue
+
+            # The message already went out, so a bad row must not stop the rest
+            # of the batch from being recorded
+            try:
+                # Queue last ping and next ping updates
+                if is_recurring:
+                    # Step from the scheduled slot rather than from now so send latency
+                    # never drifts the schedule; missed slots are skipped, not replayed
+                    step = interval * TIME_UNITS[time_unit] * 60
+                    if step <= 0:
+                        logger.error(f'Reminder {id} has no usable interval ({interval} {time_unit}), deactivating it')
+                        one_time_updates.append((now_ts, id))
+                        continue
+                    next_ping = scheduled + ((now_ts - scheduled) // step + 1) * step
+                    recurring_updates.append((now_ts, next_ping, id))
+                else:
+                    # For non-recurring reminders, deactivate after sending
+                    one_time_updates.append((now_ts, id))
+            except Exception as e:
+                # Deactivate rather than retry, or it would be resent on every retry
+                logger.error(f'Error scheduling next ping for reminder {id}: {str(e)}')
+                traceback.print_exc()
+                one_time_updates.append((now_ts, id))
+
+        if recurring_updates or one_time_updates:
+            async with bot.write_lock:
+                try:
+                    if recurring_updates:
+                        await bot.db.executemany(SQL_UPDATE_RECURRING, recurring_updates)
+                    if one_time_updates:
+                        await bot.db.executemany(SQL_UPDATE_ONE_TIME, one_time_updates)
+                    await bot.db.commit()
+                    logger.info(f"Updated {len(recurring_updates) + len(one_time_updates)} reminders after sending")
                 except Exception as e:
-                    logger.error(f'Error processing reminder {id}: {str(e)}')
+                    # Don't leave half a batch pending on the shared connection
+                    # for the next writer to commit
+                    await bot.db.rollback()
+                    logger.error(f'Error recording sent reminders: {str(e)}')
                     traceback.print_exc()
-                    continue
-                    
+
+            # Mirror the pings in the cache even if the write failed, since the
+            # messages already went out and must not be resent this session
+            for _, next_ping, id in recurring_updates:
+                row = bot.reminder_cache.get(id)
+                if row:
+                    bot.reminder_cache[id] = row[:11] + (next_ping,)
+                    heapq.heappush(schedule, (next_ping, id))
+            for _, id in one_time_updates:
+                uncache_reminder(id)
+
+        # Reminders that could not be sent stay due and are retried later
+        handled = {id for _, _, id in recurring_updates} | {id for _, id in one_time_updates}
+        retry_at = now_ts + MAX_SCHEDULER_SLEEP
+        for id in due.keys() - handled:
+            heapq.heappush(schedule, (retry_at, id))
+                
     except Exception as e:
         logger.error(f'Error in check_reminders: {str(e)}')
         traceback.print_exc()
 
+@tasks.loop()  # Paced by wait_for_next_reminder instead of a fixed interval
+async def check_reminders():
+    """Check and send reminders, then sleep until the next one is due"""
+    async with bot.reminder_lock:
+        await process_due_reminders()
+    await wait_for_next_reminder()
+
 @check_reminders.before_loop
 async def before_check_reminders():
     """Wait for the bot to be ready before starting the reminder check loop"""
@@ -1298,7 +1669,139 @@ async def on_app_command_error(interaction: discord.Interaction, error: app_comm
             ephemeral=True
         )
 
+class StaticEmbed(discord.Embed):
+    """Embed for content that never changes; to_dict() is computed once and reused"""
+    # No __slots__ here: Embed.to_dict() serializes whatever self.__slots__ names,
+    # so declaring our own would hide every field but title/description. The
+    # cached dict lives in the instance __dict__ instead.
+
+    def to_dict(self):
+        try:
+            return self._cached_dict
+        except AttributeError:
+            self._cached_dict = super().to_dict()
+            return self._cached_dict
+
+# Help embeds are static, so they are built once at import
+HELP_EMBEDS = {
+    'addping': StaticEmbed(
+        title="📌 Add Ping Command",
+        description="Create an interval-based ping that repeats at fixed intervals",
+        color=discord.Color.blue()
+    ).add_field(
+        name="Usage",
+        value=(
+            "`/addping targets:@users/roles interval:number time_unit:[minutes/hours/days] "
+            "message:your message`\n"
+            "Optional: `dm:True/False channel:#channel`"
+        ),
+        inline=False
+    ).add_field(
+        name="Examples",
+        value=(
+            "1. `/addping targets:@user interval:30 time_unit:minutes "
+            "message:Time for a break!`\n"
+            "2. `/addping targets:@role interval:2 time_unit:hours "
+            "message:Status update? channel:#team-chat`\n"
+            "3. `/addping targets:@user interval:1 time_unit:days "
+            "dm:true message:Daily medication reminder`"
+        ),
+        inline=False
+    ),
+    
+    'ghostping': StaticEmbed(
+        title="👻 Ghost Ping Command",
+        description="Create a ping that deletes itself immediately after sending (Owner only)",
+        color=discord.Color.purple()
+    ).add_field(
+        name="Usage",
+        value=(
+            "`/ghostping targets:@users/roles interval:number time_unit:[minutes/hours/days] "
+            "message:your message`\n"
+            "Optional: `channel:#channel`"
+        ),
+        inline=False
+    ).add_field(
+        name="Notes",
+        value=(
+            "- Only available to the bot owner\n"
+            "- Message is deleted immediately after sending\n"
+            "- DMs are not supported for ghost pings\n"
+            "- Can target both users and roles"
+        ),
+        inline=False
+    ),
+    
+    'list': StaticEmbed(
+        title="📋 List Command",
+        description="View all active reminders in chronological order",
+        color=discord.Color.blue()
+    ).add_field(
+        name="Usage",
+        value=(
+            "`/list`\n"
+            "Optional: `show_all:True` to include inactive reminders"
+        ),
+        inline=False
+    ).add_field(
+        name="Features",
+        value=(
+            "- Shows upcoming reminders in order\n"
+            "- Displays time until next ping\n"
+            "- Shows reminder status and type\n"
+            "- Navigate pages with buttons"
+        ),
+        inline=False
+    ),
+    # ... keep other command help entries ...
+}
+
+@functools.lru_cache(maxsize=None)
+def general_help_embed(show_owner_commands: bool) -> discord.Embed:
+    """General /help embed, built once per variant and reused, with each section in the description"""
+    sections = [
+        # Commands Overview
+        "**⚡ Available Commands**\n"
+        "`/addping` - Create interval-based ping\n"
+        "`/addreminder` - Create time-based reminder\n"
+        "`/list` - View all reminders\n"
+        "`/editping` - Modify reminder\n"
+        "`/removeping` - Delete reminder\n"
+        "`/pauseping` - Pause a reminder\n"
+        "`/resumeping` - Resume a reminder\n"
+        "`/pauseall` - Pause all reminders\n"
+        "`/setchannel` - Set default channel\n"
+        "`/settimezone` - Set server timezone\n"
+        "`/savetemplate` - Save reminder template\n"
+        "`/usetemplate` - Use saved template"
+    ]
+
+    if show_owner_commands:
+        sections.append(
+            "**🔧 Owner Commands**\n"
+            "`/ghostping` - Create self-deleting pings\n"
+            "`/setstatus` - Set bot's activity status\n"
+            "`/setnick` - Change bot's nickname\n"
+            "`/setavatar` - Update bot's profile picture\n"
+            "`/setbio` - Update bot's 'About Me' description"
+        )
+
+    # Get detailed help
+    sections.append(
+        "**📚 Detailed Help**\n"
+        "Use `/help command:<command>` for detailed information about a specific command"
+    )
+
+    return StaticEmbed(
+        title="🤖 Pingur Bot Commands",
+        description="\n\n".join(sections),
+        color=discord.Color.blue()
+    )
+
 @bot.tree.command(name="help", description="Show detailed help information")
+# Help touches no guild state, so it also works in DMs and as a user install
+@app_commands.allowed_installs(guilds=True, users=True)
+@app_commands.allowed_contexts(guilds=True, dms=True, private_channels=True)
 @app_commands.describe(
     command="Get detailed help for a specific command"
 )
@@ -1311,134 +1814,21 @@ async def help_command(
         'setstatus', 'setnick', 'setavatar', 'setbio'
     ]] = None
 ):
-    if command:
-        # Detailed help for specific command
-        embeds = {
-            'addping': discord.Embed(
-                title="📌 Add Ping Command",
-                description="Create an interval-based ping that repeats at fixed intervals",
-                color=discord.Color.blue()
-            ).add_field(
-                name="Usage",
-                value=(
-                    "`/addping targets:@users/roles interval:number time_unit:[minutes/hours/days] "
-                    "message:your message`\n"
-                    "Optional: `dm:True/False channel:#channel`"
-                ),
-                inline=False
-            ).add_field(
-                name="Examples",
-                value=(
-                    "1. `/addping targets:@user interval:30 time_unit:minutes "
-                    "message:Time for a break!`\n"
-                    "2. `/addping targets:@role interval:2 time_unit:hours "
-                    "message:Status update? channel:#team-chat`\n"
-                    "3. `/addping targets:@user interval:1 time_unit:days "
-                    "dm:true message:Daily medication reminder`"
-                ),
-                inline=False
-            ),
-            
-            'ghostping': discord.Embed(
-                title="👻 Ghost Ping Command",
-                description="Create a ping that deletes itself immediately after sending (Owner only)",
-                color=discord.Color.purple()
-            ).add_field(
-                name="Usage",
-                value=(
-                    "`/ghostping targets:@users/roles interval:number time_unit:[minutes/hours/days] "
-                    "message:your message`\n"
-                    "Optional: `channel:#channel`"
-                ),
-                inline=False
-            ).add_field(
-                name="Notes",
-                value=(
-                    "- Only available to the bot owner\n"
-                    "- Message is deleted immediately after sending\n"
-                    "- DMs are not supported for ghost pings\n"
-                    "- Can target both users and roles"
-                ),
-                inline=False
-            ),
-            
-            'list': discord.Embed(
-                title="📋 List Command",
-                description="View all active reminders in chronological order",
-                color=discord.Color.blue()
-            ).add_field(
-                name="Usage",
-                value=(
-                    "`/list`\n"
-                    "Optional: `show_all:True` to include inactive reminders"
-                ),
-                inline=False
-            ).add_field(
-                name="Features",
-                value=(
-                    "- Shows upcoming reminders in order\n"
-                    "- Displays time until next ping\n"
-                    "- Shows reminder status and type\n"
-                    "- Navigate pages with buttons"
-                ),
-                inline=False
-            ),
-            # ... keep other command help entries ...
-        }
-
-        if command in embeds:
-            await interaction.response.send_message(embed=embeds[command])
-            return
-
-    # General help
-    embed = discord.Embed(
-        title="🤖 Pingur Bot Commands",
-        color=discord.Color.blue()
-    )
-
-    # Commands Overview
-    embed.add_field(
-        name="⚡ Available Commands",
-        value=(
-            "`/addping` - Create interval-based ping\n"
-            "`/addreminder` - Create time-based reminder\n"
-            "`/list` - View all reminders\n"
-            "`/editping` - Modify reminder\n"
-            "`/removeping` - Delete reminder\n"
-            "`/pauseping` - Pause a reminder\n"
-            "`/resumeping` - Resume a reminder\n"
-            "`/pauseall` - Pause all reminders\n"
-            "`/setchannel` - Set default channel\n"
-            "`/settimezone` - Set server timezone\n"
-            "`/savetemplate` - Save reminder template\n"
-            "`/usetemplate` - Use saved template"
-        ),
-        inline=False
-    )
-
-    # Check if user is owner and show owner commands
-    app_info = await interaction.client.application_info()
-    if interaction.user.id == app_info.owner.id:
-        embed.add_field(
-            name="🔧 Owner Commands",
-            value=(
-                "`/ghostping` - Create self-deleting pings\n"
-                "`/setstatus` - Set bot's activity status\n"
-                "`/setnick` - Change bot's nickname\n"
-                "`/setavatar` - Update bot's profile picture\n"
-                "`/setbio` - Update bot's 'About Me' description"
-            ),
-            inline=False
-        )
+    if command in HELP_EMBEDS:
+        await interaction.response.send_message(embed=HELP_EMBEDS[command], ephemeral=True)
+        return
 
-    # Get detailed help
-    embed.add_field(
-        name="📚 Detailed Help",
-        value="Use `/help command:<command>` for detailed information about a specific command",
-        inline=False
-    )
+    # General help (the owner was looked up in setup_hook)
+    embed = general_help_embed(await bot.is_owner(interaction.user))
+    await interaction.response.send_message(embed=embed, ephemeral=True)
 
-    await interaction.response.send_message(embed=embed)
+INVALID_TIMEZONE_EMBED = StaticEmbed(
+    title="❌ Invalid Timezone",
+    description="Please use a valid timezone name. Examples:\n" +
+               "• `US/Pacific`\n• `US/Eastern`\n• `Europe/London`\n" +
+               "• `Asia/Tokyo`\n• `Australia/Sydney`",
+    color=discord.Color.red()
+)
 
 @bot.tree.command(name="settimezone", description="Set the timezone for this server")
 @app_commands.describe(
@@ -1449,17 +1839,14 @@ async def set_timezone(
     timezone: str
 ):
     try:
-        # Validate timezone
-        pytz.timezone(timezone)
+        # Validate timezone, accepting any capitalization of a known name
+        name = canonical_timezone(timezone)
+        if name is None:
+            raise ZoneInfoNotFoundError(timezone)
+        timezone = name
         
-        async with aiosqlite.connect(DB_PATH) as db:
-            await db.execute('''
-                INSERT INTO guild_settings (guild_id, timezone)
-                VALUES (?, ?)
-                ON CONFLICT(guild_id) 
-                DO UPDATE SET timezone = excluded.timezone
-            ''', (interaction.guild_id, timezone))
-            await db.commit()
+        settings = await db_write_fetchone(SQL_SET_TIMEZONE, (interaction.guild_id, timezone))
+        bot.guild_settings_cache[interaction.guild_id] = tuple(settings)
 
         embed = discord.Embed(
             title="✅ Timezone Set",
@@ -1467,15 +1854,8 @@ async def set_timezone(
             color=discord.Color.green()
         )
         await interaction.response.send_message(embed=embed)
-    except pytz.exceptions.UnknownTimeZoneError:
-        embed = discord.Embed(
-            title="❌ Invalid Timezone",
-            description="Please use a valid timezone name. Examples:\n" +
-                       "• `US/Pacific`\n• `US/Eastern`\n• `Europe/London`\n" +
-                       "• `Asia/Tokyo`\n• `Australia/Sydney`",
-            color=discord.Color.red()
-        )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+    except (ZoneInfoNotFoundError, ValueError):
+        await interaction.response.send_message(embed=INVALID_TIMEZONE_EMBED, ephemeral=True)
 
 @bot.tree.command(name="pauseping", description="Pause a reminder temporarily")
 @app_commands.describe(
@@ -1486,12 +1866,9 @@ async def pause_ping(
     reminder_id: Optional[int] = None
 ):
     if reminder_id is None:
-        # Show reminder selector
-        async with aiosqlite.connect(DB_PATH) as db:
-            async with db.execute('SELECT * FROM reminders WHERE guild_id = ? AND active = 1', 
-                                (interaction.guild_id,)) as cursor:
-                reminders = await cursor.fetchall()
-                
+        # Show reminder selector; active reminders are all in the cache
+        reminders = cached_guild_reminders(interaction.guild_id)
+            
         if not reminders:
             await interaction.response.send_message('❌ No active reminders found!', ephemeral=True)
             return
@@ -1504,74 +1881,68 @@ async def pause_ping(
         )
         return
 
-    async with aiosqlite.connect(DB_PATH) as db:
-        # Check if reminder exists and is active
-        async with db.execute('SELECT * FROM reminders WHERE id = ? AND guild_id = ?', 
-                            (reminder_id, interaction.guild_id)) as cursor:
-            reminder = await cursor.fetchone()
+    # Pause the reminder and read it back in the same statement
+    reminder = await db_write_fetchone(SQL_PAUSE_REMINDER, (reminder_id, interaction.guild_id))
 
-        if not reminder:
+    if not reminder:
+        # Nothing was updated: work out whether it is missing or already paused
+        existing = await db_fetchone(bot.db_read, SQL_REMINDER_STATE, (reminder_id, interaction.guild_id))
+        if not existing:
             await interaction.response.send_message('❌ Reminder not found!', ephemeral=True)
-            return
-
-        if not reminder[12]:  # active status
+        else:
             await interaction.response.send_message('❌ Reminder is already paused!', ephemeral=True)
-            return
+        return
 
-        # Pause the reminder
-        await db.execute('UPDATE reminders SET active = 0 WHERE id = ?', (reminder_id,))
-        await db.commit()
+    # Only evict once this guild's row was really paused; the id alone may
+    # belong to another server's reminder
+    uncache_reminder(reminder_id)
 
-        embed = await create_reminder_embed(interaction, reminder)
-        embed.title = "⏸️ Reminder Paused"
-        await interaction.response.send_message(embed=embed)
+    embed = await create_reminder_embed(interaction, reminder)
+    embed.title = "⏸️ Reminder Paused"
+    await interaction.response.send_message(embed=embed)
 
-@bot.tree.command(name="pauseall", description="Pause all reminders in this server")
-async def pause_all(interaction: discord.Interaction):
-    async with aiosqlite.connect(DB_PATH) as db:
-        # Get count of active reminders
-        async with db.execute('SELECT COUNT(*) FROM reminders WHERE guild_id = ? AND active = 1', 
-                            (interaction.guild_id,)) as cursor:
-            count = (await cursor.fetchone())[0]
+class PauseAllView(discord.ui.View):
+    def __init__(self, count: int):
+        super().__init__(timeout=60)
+        self.confirm.label = f"Pause {count} Reminders"
 
-        if count == 0:
-            await interaction.response.send_message('❌ No active reminders found!', ephemeral=True)
-            return
+    @discord.ui.button(label="Pause Reminders", style=discord.ButtonStyle.danger)
+    async def confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
+        paused = await db_write_fetchall(SQL_PAUSE_GUILD, (interaction.guild_id,))
+        for (rid,) in paused:
+            uncache_reminder(rid)
 
-        # Create confirmation view
-        class ConfirmView(discord.ui.View):
-            def __init__(self):
-                super().__init__(timeout=60)
-
-            @discord.ui.button(label=f"Pause {count} Reminders", style=discord.ButtonStyle.danger)
-            async def confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
-                async with aiosqlite.connect(DB_PATH) as db:
-                    await db.execute('UPDATE reminders SET active = 0 WHERE guild_id = ? AND active = 1',
-                                   (interaction.guild_id,))
-                    await db.commit()
-
-                embed = discord.Embed(
-                    title="⏸️ All Reminders Paused",
-                    description=f"Paused {count} reminders",
-                    color=discord.Color.orange()
-                )
-                await interaction.response.edit_message(embed=embed, view=None)
-
-            @discord.ui.button(label="Cancel", style=discord.ButtonStyle.grey)
-            async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
-                embed = discord.Embed(
-                    title="❌ Operation Cancelled",
-                    description="No reminders were paused",
-                    color=discord.Color.red()
-                )
-                await interaction.response.edit_message(embed=embed, view=None)
+        embed = discord.Embed(
+            title="⏸️ All Reminders Paused",
+            description=f"Paused {len(paused)} reminders",
+            color=discord.Color.orange()
+        )
+        await interaction.response.edit_message(embed=embed, view=None)
 
+    @discord.ui.button(label="Cancel", style=discord.ButtonStyle.grey)
+    async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
         embed = discord.Embed(
-            title="⚠️ Confirm Action",
-            description=f"Are you sure you want to pause all {count} active reminders?",
-            color=discord.Color.yellow()
+            title="❌ Operation Cancelled",
+            description="No reminders were paused",
+            color=discord.Color.red()
         )
-        await interaction.response.send_message(embed=embed, view=ConfirmView())
+        await interaction.response.edit_message(embed=embed, view=None)
+
+@bot.tree.command(name="pauseall", description="Pause all reminders in this server")
+async def pause_all(interaction: discord.Interaction):
+    # The cache holds exactly the active reminders, so count them there
+    count = len(bot.guild_reminder_ids.get(interaction.guild_id, ()))
+
+    if count == 0:
+        await interaction.response.send_message('❌ No active reminders found!', ephemeral=True)
+        return
+
+    embed = discord.Embed(
+        title="⚠️ Confirm Action",
+        description=f"Are you sure you want to pause all {count} active reminders?",
+        color=discord.Color.yellow()
+    )
+    await interaction.response.send_message(embed=embed, view=PauseAllView(count))
 
 @bot.tree.command(name="resumeping", description="Resume a paused reminder")
 @app_commands.describe(
@@ -1583,11 +1954,8 @@ async def resume_ping(
 ):
     if reminder_id is None:
         # Show reminder selector
-        async with aiosqlite.connect(DB_PATH) as db:
-            async with db.execute('SELECT * FROM reminders WHERE guild_id = ? AND active = 0', 
-                                (interaction.guild_id,)) as cursor:
-                reminders = await cursor.fetchall()
-                
+        reminders = await bot.db_read.execute_fetchall(SQL_GUILD_REMINDERS_BY_ACTIVE, (interaction.guild_id, 0))
+            
         if not reminders:
             await interaction.response.send_message('❌ No paused reminders found!', ephemeral=True)
             return
@@ -1600,41 +1968,35 @@ async def resume_ping(
         )
         return
 
-    async with aiosqlite.connect(DB_PATH) as db:
-        # Check if reminder exists and is paused
-        async with db.execute('SELECT * FROM reminders WHERE id = ? AND guild_id = ?', 
-                            (reminder_id, interaction.guild_id)) as cursor:
-            reminder = await cursor.fetchone()
+    # Check if reminder exists and is paused
+    state = await db_fetchone(bot.db_read, SQL_REMINDER_STATE, (reminder_id, interaction.guild_id))
 
-        if not reminder:
-            await interaction.response.send_message('❌ Reminder not found!', ephemeral=True)
-            return
+    if not state:
+        await interaction.response.send_message('❌ Reminder not found!', ephemeral=True)
+        return
 
-        if reminder[12]:  # active status
-            await interaction.response.send_message('❌ Reminder is already active!', ephemeral=True)
-            return
+    active, interval, time_unit = state
+    if active:
+        await interaction.response.send_message('❌ Reminder is already active!', ephemeral=True)
+        return
 
-        # Calculate next ping time
-        now = datetime.now()
-        interval_minutes = reminder[7] * TIME_UNITS[reminder[8]]  # interval * unit multiplier
-        next_ping = now + timedelta(minutes=interval_minutes)
+    # Calculate next ping time (Unix seconds)
+    next_ping = int(time.time()) + interval * TIME_UNITS[time_unit] * 60
 
-        # Resume the reminder
-        await db.execute('''
-            UPDATE reminders 
-            SET active = 1, next_ping = ? 
-            WHERE id = ?
-        ''', (next_ping.isoformat(), reminder_id))
-        await db.commit()
+    # Resume the reminder; the returned row feeds both the cache and the embed
+    reminder = await db_write_fetchone(SQL_RESUME_REMINDER, (next_ping, reminder_id))
+    if not reminder:
+        await interaction.response.send_message('❌ Reminder is already active!', ephemeral=True)
+        return
+    cache_reminders([active_reminder_columns(reminder)])
 
-        embed = await create_reminder_embed(interaction, reminder)
-        embed.title = "▶️ Reminder Resumed"
-        await interaction.response.send_message(embed=embed)
+    embed = await create_reminder_embed(interaction, reminder)
+    embed.title = "▶️ Reminder Resumed"
+    await interaction.response.send_message(embed=embed)
 
 class ReminderSelectView(discord.ui.View):
     def __init__(self, reminders, action):
         super().__init__(timeout=60)
-        self.reminders = reminders
         self.action = action
         
         # Create select menu with reminders
@@ -1643,7 +2005,7 @@ class ReminderSelectView(discord.ui.View):
             options=[
                 discord.SelectOption(
                     label=f"Reminder #{r[0]}",
-                    description=f"{r[6][:50]}...",  # First 50 chars of message
+                    description=f"{r[1][:50]}...",  # First 50 chars of message
                     value=str(r[0])
                 ) for r in reminders[:25]  # Discord limit of 25 options
             ]
@@ -1659,77 +2021,69 @@ class ReminderSelectView(discord.ui.View):
         select.callback = select_callback
         self.add_item(select)
 
-@bot.tree.command(name="removereminder", description="Delete a one-time reminder")
-async def remove_reminder(interaction: discord.Interaction):
-    try:
-        await interaction.response.defer()
+class DeleteView(discord.ui.View):
+    def __init__(self, reminders, kind):
+        super().__init__(timeout=60)
+        # kind is "reminder" or "ping" and only changes the wording
+        self.kind = kind
         
-        # Show reminder selector
-        async with aiosqlite.connect(DB_PATH) as db:
-            async with db.execute(
-                'SELECT * FROM reminders WHERE guild_id = ? AND recurring = 0', 
-                (interaction.guild_id,)
-            ) as cursor:
-                reminders = await cursor.fetchall()
-                
-        if not reminders:
-            await interaction.followup.send('❌ No reminders found!', ephemeral=True)
-            return
-
         # Create select menu with reminders
-        select = discord.ui.Select(
-            placeholder="Choose a reminder to delete",
+        self.select = discord.ui.Select(
+            placeholder=f"Choose a {kind} to delete",
             options=[
                 discord.SelectOption(
-                    label=f"Reminder #{r[0]}",
-                    description=f"{r[6][:50]}...",  # First 50 chars of message
+                    label=f"{kind.capitalize()} #{r[0]}",
+                    description=f"{r[1][:50]}...",  # First 50 chars of message
                     value=str(r[0])
                 ) for r in reminders[:25]  # Discord limit of 25 options
             ]
         )
-        
-        class DeleteView(discord.ui.View):
-            def __init__(self):
-                super().__init__(timeout=60)
-                self.add_item(select)
+        self.add_item(self.select)
+    
+    async def handle_delete(self, interaction: discord.Interaction, rid: int):
+        # Delete the reminder, scoped to this guild, and learn whether it existed
+        deleted = await db_write_fetchone(SQL_DELETE_REMINDER, (rid, interaction.guild_id))
             
-            async def handle_delete(self, interaction: discord.Interaction, rid: int):
-                async with aiosqlite.connect(DB_PATH) as db:
-                    # Get reminder details first
-                    async with db.execute('SELECT * FROM reminders WHERE id = ? AND guild_id = ?', 
-                                        (rid, interaction.guild_id)) as cursor:
-                        reminder = await cursor.fetchone()
-                        
-                    if not reminder:
-                        await interaction.response.send_message('❌ Reminder not found!', ephemeral=True)
-                        return
-                    
-                    # Delete the reminder
-                    await db.execute('DELETE FROM reminders WHERE id = ?', (rid,))
-                    await db.commit()
-                    
-                    embed = discord.Embed(
-                        title="✅ Reminder Deleted",
-                        description=f"Reminder #{rid} has been deleted",
-                        color=discord.Color.red()
-                    )
-                    await interaction.response.edit_message(embed=embed, view=None)
+        if not deleted:
+            await interaction.response.send_message(f'❌ {self.kind.capitalize()} not found!', ephemeral=True)
+            return
+        
+        uncache_reminder(rid)
+        
+        embed = discord.Embed(
+            title=f"✅ {self.kind.capitalize()} Deleted",
+            description=f"{self.kind.capitalize()} #{rid} has been deleted",
+            color=discord.Color.red()
+        )
+        await interaction.response.edit_message(embed=embed, view=None)
+
+    @discord.ui.button(label="Confirm Delete", style=discord.ButtonStyle.danger)
+    async def confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
+        rid = int(self.select.values[0])
+        await self.handle_delete(interaction, rid)
+    
+    @discord.ui.button(label="Cancel", style=discord.ButtonStyle.grey)
+    async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
+        embed = discord.Embed(
+            title="❌ Operation Cancelled",
+            description=f"No {self.kind}s were deleted",
+            color=discord.Color.green()
+        )
+        await interaction.response.edit_message(embed=embed, view=None)
 
-            @discord.ui.button(label="Confirm Delete", style=discord.ButtonStyle.danger)
-            async def confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
-                rid = int(select.values[0])
-                await self.handle_delete(interaction, rid)
+@bot.tree.command(name="removereminder", description="Delete a one-time reminder")
+async def remove_reminder(interaction: discord.Interaction):
+    try:
+        await interaction.response.defer()
+        
+        # Show reminder selector
+        reminders = await bot.db_read.execute_fetchall(SQL_GUILD_REMINDERS_BY_RECURRING, (interaction.guild_id, 0))
             
-            @discord.ui.button(label="Cancel", style=discord.ButtonStyle.grey)
-            async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
-                embed = discord.Embed(
-                    title="❌ Operation Cancelled",
-                    description="No reminders were deleted",
-                    color=discord.Color.green()
-                )
-                await interaction.response.edit_message(embed=embed, view=None)
+        if not reminders:
+            await interaction.followup.send('❌ No reminders found!', ephemeral=True)
+            return
 
-        view = DeleteView()
+        view = DeleteView(reminders, "reminder")
         await interaction.followup.send(
             "Select a reminder to delete:",
             view=view,
@@ -1749,71 +2103,13 @@ async def remove_ping(interaction: discord.Interaction):
         await interaction.response.defer()
         
         # Show ping selector
-        async with aiosqlite.connect(DB_PATH) as db:
-            async with db.execute(
-                'SELECT * FROM reminders WHERE guild_id = ? AND recurring = 1', 
-                (interaction.guild_id,)
-            ) as cursor:
-                reminders = await cursor.fetchall()
-                
+        reminders = await bot.db_read.execute_fetchall(SQL_GUILD_REMINDERS_BY_RECURRING, (interaction.guild_id, 1))
+            
         if not reminders:
             await interaction.followup.send('❌ No pings found!', ephemeral=True)
             return
 
-        # Create select menu with pings
-        select = discord.ui.Select(
-            placeholder="Choose a ping to delete",
-            options=[
-                discord.SelectOption(
-                    label=f"Ping #{r[0]}",
-                    description=f"{r[6][:50]}...",  # First 50 chars of message
-                    value=str(r[0])
-                ) for r in reminders[:25]  # Discord limit of 25 options
-            ]
-        )
-        
-        class DeleteView(discord.ui.View):
-            def __init__(self):
-                super().__init__(timeout=60)
-                self.add_item(select)
-            
-            async def handle_delete(self, interaction: discord.Interaction, rid: int):
-                async with aiosqlite.connect(DB_PATH) as db:
-                    # Get ping details first
-                    async with db.execute('SELECT * FROM reminders WHERE id = ? AND guild_id = ?', 
-                                        (rid, interaction.guild_id)) as cursor:
-                        reminder = await cursor.fetchone()
-                        
-                    if not reminder:
-                        await interaction.followup.send('❌ Ping not found!', ephemeral=True)
-                        return
-                    
-                    # Delete the ping
-                    await db.execute('DELETE FROM reminders WHERE id = ?', (rid,))
-                    await db.commit()
-                    
-                    embed = discord.Embed(
-                        title="✅ Ping Deleted",
-                        description=f"Ping #{rid} has been deleted",
-                        color=discord.Color.red()
-                    )
-                    await interaction.response.edit_message(embed=embed, view=None)
-
-            @discord.ui.button(label="Confirm Delete", style=discord.ButtonStyle.danger)
-            async def confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
-                rid = int(select.values[0])
-                await self.handle_delete(interaction, rid)
-            
-            @discord.ui.button(label="Cancel", style=discord.ButtonStyle.grey)
-            async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
-                embed = discord.Embed(
-                    title="❌ Operation Cancelled",
-                    description="No pings were deleted",
-                    color=discord.Color.green()
-                )
-                await interaction.response.edit_message(embed=embed, view=None)
-
-        view = DeleteView()
+        view = DeleteView(reminders, "ping")
         await interaction.followup.send(
             "Select a ping to delete:",
             view=view,
@@ -1827,10 +2123,16 @@ async def remove_ping(interaction: discord.Interaction):
             ephemeral=True
         )
 
+@bot.command(name="sync")
+@commands.is_owner()
+async def sync_commands(ctx: commands.Context):
+    """Push the global slash command list to Discord (Owner only)"""
+    synced = await sync_global_commands()
+    await ctx.send(f"✅ Synced {len(synced)} commands globally")
+
 def is_bot_owner():
     async def predicate(interaction: discord.Interaction):
-        app_info = await interaction.client.application_info()
-        if interaction.user.id != app_info.owner.id:
+        if not await interaction.client.is_owner(interaction.user):
             raise app_commands.CheckFailure("This command is only available to the bot owner.")
         return True
     return app_commands.check(predicate)
@@ -1924,16 +2226,15 @@ async def set_avatar(
     url: str
 ):
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                if response.status != 200:
-                    await interaction.response.send_message(
-                        "❌ Failed to download image!",
-                        ephemeral=True
-                    )
-                    return
-                
-                avatar_bytes = await response.read()
+        async with bot.http_session.get(url) as response:
+            if response.status != 200:
+                await interaction.response.send_message(
+                    "❌ Failed to download image!",
+                    ephemeral=True
+                )
+                return
+            
+            avatar_bytes = await response.read()
                 
         await bot.user.edit(avatar=avatar_bytes)
         embed = discord.Embed(
@@ -2002,14 +2303,13 @@ async def ghost_ping(
     interaction: discord.Interaction,
     targets: str,
     time_unit: Literal['minutes', 'hours', 'days'],
-    interval: int,
+    interval: app_commands.Range[int, 1],  # A zero interval would have no next ping
     message: str,
     channel: Optional[discord.TextChannel] = None
 ):
     try:
         # Check if user is the bot owner
-        app_info = await bot.application_info()
-        if interaction.user.id != app_info.owner.id:
+        if not await bot.is_owner(interaction.user):
             await interaction.response.send_message("❌ This command is only available to the bot owner!", ephemeral=True)
             return
 
@@ -2044,63 +2344,18 @@ async def ghost_ping(
             return
 
         # Get server timezone
-        async with aiosqlite.connect(DB_PATH) as db:
-            async with db.execute('SELECT timezone FROM guild_settings WHERE guild_id = ?', 
-                                (interaction.guild_id,)) as cursor:
-                result = await cursor.fetchone()
-                timezone = result[0] if result else 'UTC'
-
-        tz = pytz.timezone(timezone)
+        tz = ZoneInfo(get_guild_timezone(interaction.guild_id))
         now = datetime.now(tz)
 
         # Parse targets (users and roles)
-        target_ids = []
-        target_type = None
-        
-        for word in targets.split():
-            target_id = None
-            is_role = False
-
-            if word.startswith('<@&'):  # Role mention
-                try:
-                    target_id = int(word[3:-1])
-                    is_role = True
-                except ValueError as e:
-                    logger.error(f"Failed to parse role ID from {word}: {str(e)}")
-                    continue
-            elif word.startswith('<@'):  # User mention
-                try:
-                    target_id = int(word[2:-1].replace('!', ''))
-                except ValueError as e:
-                    logger.error(f"Failed to parse user ID from {word}: {str(e)}")
-                    continue
-            else:  # Raw ID
-                try:
-                    target_id = int(word)
-                    # Check if it's a role ID
-                    role = interaction.guild.get_role(target_id)
-                    if role:
-                        is_role = True
-                    else:
-                        # Check if it's a valid user ID
-                        member = interaction.guild.get_member(target_id)
-                        if not member:
-                            logger.error(f"Could not find member or role with ID {target_id}")
-                            continue
-                except ValueError as e:
-                    logger.error(f"Failed to parse ID from {word}: {str(e)}")
-                    continue
-
-            if target_id:
-                if not target_type:
-                    target_type = 'role' if is_role else 'user'
-                elif (target_type == 'role') != is_role:
-                    await interaction.followup.send(
-                        "Cannot mix users and roles in the same ping!",
-                        ephemeral=True
-                    )
-                    return
-                target_ids.append(target_id)
+        parsed = parse_targets(interaction.guild, targets)
+        if parsed is None:
+            await interaction.followup.send(
+                "Cannot mix users and roles in the same ping!",
+                ephemeral=True
+            )
+            return
+        target_ids, target_type = parsed
 
         if not target_ids:
             await interaction.followup.send(
@@ -2134,11 +2389,7 @@ async def ghost_ping(
             channel_id = interaction.channel_id
             if not channel_id:
                 # If not in a channel, try to use the default channel
-                async with aiosqlite.connect(DB_PATH) as db:
-                    async with db.execute('SELECT default_channel_id FROM guild_settings WHERE guild_id = ?', 
-                                        (interaction.guild_id,)) as cursor:
-                        result = await cursor.fetchone()
-                        channel_id = result[0] if result else None
+                channel_id = get_default_channel(interaction.guild_id)
 
                 if not channel_id:
                     await interaction.followup.send(
@@ -2147,56 +2398,31 @@ async def ghost_ping(
                     )
                     return
 
-        # Calculate next ping time
-        interval_minutes = interval * TIME_UNITS[time_unit]
-        next_ping = now + timedelta(minutes=interval_minutes)
-        
-        # Ensure timezone-aware datetime storage
-        if next_ping.tzinfo is None:
-            next_ping = tz.localize(next_ping)
-        next_ping = next_ping.astimezone(pytz.utc)
+        # Calculate next ping time (Unix seconds)
+        now_ts = int(now.timestamp())
+        next_ping = now_ts + interval * TIME_UNITS[time_unit] * 60
 
         # Insert the reminder with ghost flag
-        async with aiosqlite.connect(DB_PATH) as db:
-            cursor = await db.execute('''
-                INSERT INTO reminders (
-                    guild_id, channel_id, user_id, target_ids, target_type,
-                    message, interval, time_unit, last_ping, next_ping,
-                    dm, recurring, active, ghost_ping
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                interaction.guild_id, 
-                channel_id,
-                interaction.user.id,
-                ','.join(map(str, target_ids)),
-                target_type,
-                message,
-                interval,
-                time_unit,
-                now.astimezone(pytz.utc).isoformat(),  # Store in UTC
-                next_ping.isoformat(),
-                False,  # DM not allowed for ghost pings
-                True,  # Always recurring for interval-based pings
-                True,
-                True  # This is a ghost ping
-            ))
-            await db.commit()
-            
-            # Get the ID of the inserted reminder
-            cursor = await db.execute('SELECT last_insert_rowid()')
-            row = await cursor.fetchone()
-            reminder_id = row[0]
+        reminder = await insert_reminder((
+            interaction.guild_id, 
+            channel_id,
+            interaction.user.id,
+            ','.join(map(str, target_ids)),
+            target_type,
+            message,
+            interval,
+            time_unit,
+            now_ts,  # Unix seconds
+            next_ping,
+            False,  # DM not allowed for ghost pings
+            True,  # Always recurring for interval-based pings
+            True,
+            True  # This is a ghost ping
+        ))
+        reminder_id = reminder[0]
 
         # Get targets for display
-        targets_display = []
-        for tid in target_ids:
-            if target_type == 'user':
-                target = interaction.guild.get_member(int(tid))
-            else:
-                target = interaction.guild.get_role(int(tid))
-            if target:
-                targets_display.append(target.mention)
+        targets_display = resolve_targets(interaction.guild, target_ids, target_type)
 
         # Get channel for display
         channel_display = interaction.guild.get_channel(channel_id)
@@ -2224,6 +2450,10 @@ async def ghost_ping(
 def main():
     try:
         logger.info("Starting Pingur bot...")
+        if uvloop is not None:
+            # bot.run goes through asyncio.run, which picks up the policy
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            logger.info("Using uvloop event loop")
         bot.run(TOKEN, log_handler=None)  # Disable default discord.py logging
     except discord.LoginFailure:
         logger.error("Failed to login! Check your Discord token.")